@@ -6,15 +6,28 @@ Downloads updates from GitHub repository
 import os
 import json
 import hashlib
+import io
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import shutil
 import tempfile
+import zipfile
 import stat
+import py_compile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, List, Dict, Callable
 from pathlib import Path
 from datetime import datetime
 
+# Version of the install layout vouched for by the first-run marker (part of the marker's file name)
+INSTALL_MARKER_VERSION = 1
+
+# Read size when hashing local files (matches the 1MB download chunks; 4KB reads meant thousands of loop iterations per asset)
+HASH_BLOCK_SIZE = 1024 * 1024
+
 class AutoUpdater:
     """Handles auto-updates from GitHub repository"""
     
@@ -38,11 +51,27 @@ class AutoUpdater:
         # Legacy support
         self.local_version_file = os.path.join('.toa', 'version.json')
         self.remote_version_file = 'version.json'
+        # Written after the first install succeeds so is_first_run() is a single stat
+        self.install_marker_file = os.path.join('.toa', f'.installed.v{INSTALL_MARKER_VERSION}')
         # Backup folder for rollback
         self.backup_folder = os.path.join('.toa', 'backup')
         # Chunk size for downloads (1MB)
         self.chunk_size = 1024 * 1024
         self._lock_file = None
+        # Remote manifest from the last update check, reused for file sizes
+        self._remote_manifest = None
+        # ETag of the last manifest response; saved (with the version it describes) once we're up to date
+        self._remote_manifest_etag = None
+        self.manifest_etag_file = os.path.join('.toa', '.manifest_etag')
+        # When the last check found the install up to date (lets quick restarts skip the network)
+        self.update_cache_file = os.path.join('.toa', '.update_cache.json')
+        # One keep-alive session for every request so files after the first skip the TCP/TLS handshake
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self._session.mount('https://', adapter)
+        # Parallel file downloads (stays below the adapter's pool_maxsize)
+        self.max_download_workers = 8
         # Debug log file
         self.log_file = os.path.join('.toa', 'update_debug.log') if os.path.exists('.toa') else 'update_debug.log'
     
@@ -61,17 +90,44 @@ class AutoUpdater:
         Returns:
             True if this is first run, False otherwise
         """
-        # Check if essential files/folders exist in hidden folder
+        if os.path.exists(self.install_marker_file):
+            return False
+        return not self._has_unmarked_install()
+    
+    def _has_unmarked_install(self) -> bool:
+        """Check for an install from before the marker existed (essential files/folders in hidden folder)"""
         # Note: beatmaps and levels are generated from .osz, not downloaded
         hidden_folder = '.toa'
         if not os.path.exists(hidden_folder):
-            return True
+            return False
         required_paths = ['assets', 'main.py']
         for path in required_paths:
             full_path = os.path.join(hidden_folder, path)
             if not os.path.exists(full_path):
-                return True
-        return False
+                return False
+        return True
+    
+    def migrate_install_marker(self):
+        """Write the first-run marker once for installs from before it existed, so later checks are a single stat"""
+        if not os.path.exists(self.install_marker_file) and self._has_unmarked_install():
+            self.mark_installed()
+    
+    def mark_installed(self):
+        """Write the first-run marker (installed version + file count) after a successful initial install"""
+        try:
+            manifest = self._get_local_manifest()
+            marker = {
+                'layout': INSTALL_MARKER_VERSION,
+                'version': manifest.get('version', '0.0.0'),
+                'files': sum(len(files) for files in manifest.get('files', {}).values())
+            }
+            # Write then os.replace, so the marker only ever appears complete
+            temp_path = self.install_marker_file + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(marker, f)
+            os.replace(temp_path, self.install_marker_file)
+        except Exception as e:
+            self._log(f"Could not write install marker: {e}")
     
     def get_all_remote_files(self) -> List[str]:
         """
@@ -129,7 +185,10 @@ class AutoUpdater:
         try:
             # Get local and remote manifests
             local_manifest = self._get_local_manifest()
-            remote_manifest = self._get_remote_manifest()
+            # Conditional GET: a 304 means nothing changed since we were last up to date
+            etag = self._load_manifest_etag(local_manifest.get('version', '0.0.0'))
+            remote_manifest = self._get_remote_manifest(etag)
+            self._remote_manifest = remote_manifest
             
             if not remote_manifest:
                 # Fallback to legacy version.json system
@@ -141,6 +200,10 @@ class AutoUpdater:
             
             # Compare versions - if same version, no updates needed
             if local_version == remote_version:
+                # A 200 can carry a new ETag for the same version - keep the saved one current
+                if self._remote_manifest_etag != etag:
+                    self._save_manifest_etag(local_version)
+                self._record_update_check()
                 return False, [], {}
             
             # If remote is older, no updates
@@ -206,6 +269,35 @@ class AutoUpdater:
             print(f"Error checking for updates: {e}")
             return False, [], {}
     
+    def get_download_sizes(self, files: List[str]) -> Dict[str, int]:
+        """
+        Look up the size of each file in the remote manifest
+        
+        Args:
+            files: File paths as returned by get_all_remote_files/check_for_updates
+            
+        Returns:
+            Dict mapping file path to size in bytes (0 if unknown)
+        """
+        remote_manifest = self.prefetch_remote_manifest()
+        return {file_path: self._get_file_size_from_manifest(remote_manifest, file_path) for file_path in files}
+    
+    def prefetch_remote_manifest(self) -> Optional[Dict]:
+        """Fetch the remote manifest once and keep it for sizes, hashes and the download itself"""
+        if self._remote_manifest is None:
+            self._remote_manifest = self._get_remote_manifest()
+        return self._remote_manifest
+    
+    def warm_up_connection(self):
+        """Open a pooled keep-alive connection to the archive host before the zipball is requested"""
+        try:
+            # Straight through the session adapter's pool (so the connection is reused by the
+            # download) but without its retries - a failed warm-up is not worth backing off for
+            url = "https://codeload.github.com/"
+            self._session.get_adapter(url).poolmanager.urlopen('HEAD', url, retries=False, timeout=5)
+        except:
+            pass  # Only an optimization
+    
     def download_updates(self, files_to_download: List[str], progress_callback: Callable[[int, int, str, int, int], None] = None, is_initial_download: bool = False, create_backup: bool = True) -> bool:
         """
         Download updated files from GitHub with chunked download and hash verification
@@ -233,9 +325,7 @@ class AutoUpdater:
             
             # Set folder as hidden + system on Windows
             if os.name == 'nt':
-                import subprocess
                 import ctypes
-                subprocess.run(['attrib', '+H', '+S', data_folder], shell=True, capture_output=True)
                 try:
                     ctypes.windll.kernel32.SetFileAttributesW(data_folder, 0x02 | 0x04)
                 except:
@@ -247,23 +337,55 @@ class AutoUpdater:
             
             total_files = len(files_to_download)
             failed_files = []
-            remote_manifest = self._get_remote_manifest()
+            # Reuse the manifest from check_for_updates/prefetch instead of another round-trip
+            remote_manifest = self.prefetch_remote_manifest()
             log(f"Remote manifest fetched, version: {remote_manifest.get('version', 'unknown') if remote_manifest else 'FAILED'}")
             
-            for idx, file_path in enumerate(files_to_download):
-                log(f"Downloading {idx+1}/{total_files}: {file_path}")
+            # Largest files first so the tail of tiny files doesn't stretch the end of the progress bar
+            file_sizes = {file_path: self._get_file_size_from_manifest(remote_manifest, file_path) for file_path in files_to_download}
+            files_to_download = sorted(files_to_download, key=file_sizes.get, reverse=True)
+            
+            # Files are fetched concurrently over the session's connection pool; progress_callback
+            # is therefore invoked from worker threads with current = number of finished files.
+            # Batching code files into one GraphQL request is not an option: the GraphQL API requires
+            # an auth token, and the pooled keep-alive connections already skip per-file handshakes
+            completed = [0]
+            completed_lock = threading.Lock()
+            
+            def download_one(file_path):
                 # Get expected hash from manifest
                 expected_hash = self._get_file_hash_from_manifest(remote_manifest, file_path)
-                log(f"  Expected hash: {expected_hash[:16]}...")
+                
+                file_downloaded = [0]
+                
+                def on_chunk(downloaded, total):
+                    file_downloaded[0] = downloaded
+                    if progress_callback:
+                        progress_callback(completed[0], total_files, file_path, downloaded, total)
                 
                 # Download with chunked streaming and hash verification
                 success = self._download_file_chunked(
                     file_path, 
                     data_folder, 
                     expected_hash,
-                    lambda downloaded, total: progress_callback(idx + 1, total_files, file_path, downloaded, total) if progress_callback else None
+                    on_chunk,
+                    expected_size=file_sizes[file_path]
                 )
                 
+                with completed_lock:
+                    completed[0] += 1
+                    done = completed[0]
+                if progress_callback:
+                    # Final report for this file (drops the bytes of a download that failed verification)
+                    final_bytes = file_downloaded[0] if success else 0
+                    progress_callback(done, total_files, file_path, final_bytes, final_bytes)
+                return success
+            
+            with ThreadPoolExecutor(max_workers=self.max_download_workers) as executor:
+                results = list(executor.map(download_one, files_to_download))
+            
+            for idx, (file_path, success) in enumerate(zip(files_to_download, results)):
+                log(f"Downloaded {idx+1}/{total_files}: {file_path}")
                 if not success:
                     log(f"  FAILED to download: {file_path}")
                     print(f"FAILED to download: {file_path}")
@@ -271,8 +393,6 @@ class AutoUpdater:
                 else:
                     log(f"  [OK] Successfully downloaded: {file_path}")
                     print(f"[OK] Downloaded: {file_path}")
-                
-                time.sleep(0.1)
             
             # Only update manifest if ALL files downloaded successfully
             if len(failed_files) == 0:
@@ -287,7 +407,7 @@ class AutoUpdater:
                     for config_file in ['update_config.json', 'toa_settings.json']:
                         try:
                             url = f"{self.raw_url}/{config_file}"
-                            response = requests.get(url, timeout=10)
+                            response = self._session.get(url, timeout=10)
                             if response.status_code == 200:
                                 with open(os.path.join(data_folder, config_file), 'wb') as f:
                                     f.write(response.content)
@@ -325,7 +445,7 @@ class AutoUpdater:
                 'Pragma': 'no-cache',
                 'Expires': '0'
             }
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._session.get(url, headers=headers, timeout=10)
             
             if response.status_code == 200:
                 return json.loads(response.content)
@@ -361,7 +481,7 @@ class AutoUpdater:
         try:
             sha256_hash = hashlib.sha256()
             with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
+                for byte_block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
                     sha256_hash.update(byte_block)
             return sha256_hash.hexdigest()
         except:
@@ -378,8 +498,14 @@ class AutoUpdater:
         # Fallback to version.json
         return self._get_local_version()
     
-    def _get_remote_manifest(self) -> Optional[Dict]:
-        """Get remote manifest from GitHub with cache-busting"""
+    def _get_remote_manifest(self, etag: str = None) -> Optional[Dict]:
+        """
+        Get remote manifest from GitHub with cache-busting
+        
+        Args:
+            etag: ETag saved while the local manifest matched the remote one. If GitHub answers
+                  304 Not Modified the remote manifest is still the local one, which is returned.
+        """
         try:
             # Add timestamp to URL to bypass CDN cache completely
             import time
@@ -390,8 +516,14 @@ class AutoUpdater:
                 'Pragma': 'no-cache',
                 'Expires': '0'
             }
-            response = requests.get(url, headers=headers, timeout=10)
+            if etag:
+                headers['If-None-Match'] = etag
+            response = self._session.get(url, headers=headers, timeout=10)
+            if response.status_code == 304:
+                self._remote_manifest_etag = etag
+                return self._get_local_manifest()
             if response.status_code == 200:
+                self._remote_manifest_etag = response.headers.get('ETag')
                 return json.loads(response.content)
         except:
             pass
@@ -404,9 +536,48 @@ class AutoUpdater:
             os.makedirs('.toa', exist_ok=True)
             with open(self.local_manifest_file, 'w') as f:
                 json.dump(manifest, f, indent=2)
+            self._save_manifest_etag(manifest.get('version', '0.0.0'))
         except Exception as e:
             print(f"Error updating manifest: {e}")
     
+    def _load_manifest_etag(self, local_version: str) -> Optional[str]:
+        """Get the saved manifest ETag, but only if it was saved for the installed version"""
+        try:
+            with open(self.manifest_etag_file, 'r') as f:
+                saved = json.load(f)
+            if saved.get('version') == local_version:
+                return saved.get('etag')
+        except:
+            pass
+        return None
+    
+    def checked_recently(self, interval_seconds: float) -> bool:
+        """True if a check within the last interval_seconds found no updates"""
+        try:
+            with open(self.update_cache_file, 'r') as f:
+                last_check = json.load(f)['ts']
+            return 0 <= time.time() - last_check < interval_seconds
+        except:
+            return False
+    
+    def _record_update_check(self):
+        """Remember that the install was up to date just now"""
+        try:
+            with open(self.update_cache_file, 'w') as f:
+                json.dump({'ts': time.time()}, f)
+        except:
+            pass  # Only an optimization
+    
+    def _save_manifest_etag(self, version: str):
+        """Remember the ETag of the manifest that the local install now matches"""
+        if not self._remote_manifest_etag:
+            return
+        try:
+            with open(self.manifest_etag_file, 'w') as f:
+                json.dump({'etag': self._remote_manifest_etag, 'version': version}, f)
+        except:
+            pass  # Only an optimization
+    
     def _version_compare(self, version1: str, version2: str) -> int:
         """Compare two version strings. Returns: 1 if v1 > v2, -1 if v1 < v2, 0 if equal"""
         try:
@@ -423,16 +594,20 @@ class AutoUpdater:
         except:
             return 0
     
+    def _get_manifest_entry(self, manifest: Dict, file_path: str):
+        """Get a file's manifest entry (either a hash string or a dict with 'hash' and 'size')"""
+        files = manifest.get('files', {})
+        # Handle both 'assets/file.png' and 'file.py' paths (and os.path.join'd Windows paths)
+        file_path = file_path.replace('\\', '/')
+        if '/' in file_path:
+            dir_name, file_name = file_path.split('/', 1)
+            return files.get(dir_name, {}).get(file_name, '')
+        return files.get('code', {}).get(file_path, '')
+    
     def _get_file_hash_from_manifest(self, manifest: Dict, file_path: str) -> str:
         """Extract expected file hash from manifest"""
         try:
-            files = manifest.get('files', {})
-            # Handle both 'assets/file.png' and 'file.py' paths
-            if '/' in file_path:
-                dir_name, file_name = file_path.split('/', 1)
-                file_info = files.get(dir_name, {}).get(file_name, '')
-            else:
-                file_info = files.get('code', {}).get(file_path, '')
+            file_info = self._get_manifest_entry(manifest, file_path)
             
             # Handle both string hash and dict with 'hash' key
             if isinstance(file_info, str):
@@ -443,97 +618,202 @@ class AutoUpdater:
             pass
         return ''
     
-    def _download_file_chunked(self, file_path: str, data_folder: str, expected_hash: str, progress_callback: Callable = None) -> bool:
+    def _get_file_size_from_manifest(self, manifest: Dict, file_path: str) -> int:
+        """Extract file size in bytes from manifest (0 if the manifest has no size for it)"""
+        try:
+            file_info = self._get_manifest_entry(manifest, file_path)
+            if isinstance(file_info, dict):
+                return file_info.get('size', 0)
+        except:
+            pass
+        return 0
+    
+    def _content_hash(self, file_path: str, content: bytes) -> str:
+        """Hash downloaded content the way the manifest does (.py files with normalized line endings)"""
+        if file_path.endswith('.py'):
+            try:
+                text = content.decode('utf-8').replace('\r\n', '\n')
+                return hashlib.sha256(text.encode('utf-8')).hexdigest()
+            except:
+                pass  # Fallback to binary hash
+        return hashlib.sha256(content).hexdigest()
+    
+    def _install_file(self, file_path: str, data_folder: str, content: bytes):
+        """Write verified content to its final location atomically through a .part file (raises on failure)"""
+        local_path = os.path.join(data_folder, file_path)
+        Path(local_path).parent.mkdir(parents=True, exist_ok=True)
+        temp_path = local_path + '.part'
+        
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+                # Make sure the bytes are on disk before the rename makes them visible
+                f.flush()
+                os.fsync(f.fileno())
+            
+            if os.path.exists(local_path):
+                # Remove read-only attribute if present (Windows refuses to replace read-only files)
+                try:
+                    os.chmod(local_path, stat.S_IWRITE | stat.S_IREAD)
+                except Exception as chmod_err:
+                    self._log(f"  Warning: Could not change permissions: {chmod_err}")
+            # Atomic swap - a crash leaves either the old file or the new one, never a torn write
+            os.replace(temp_path, local_path)
+        except:
+            if os.path.exists(temp_path):
+                try:
+                    os.remove(temp_path)
+                except:
+                    pass
+            raise
+        
+        if file_path.endswith('.py'):
+            # Compile once now: the frozen exe runs with dont_write_bytecode, so without this every
+            # launch would re-parse and re-compile the source instead of loading __pycache__
+            try:
+                py_compile.compile(local_path, doraise=True)
+            except Exception as e:
+                self._log(f"  Warning: Could not compile {file_path}: {e}")
+            
+            # Make Python code files read-only for protection
+            try:
+                os.chmod(local_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            except:
+                pass  # Not critical if this fails
+    
+    def _download_file_chunked(self, file_path: str, data_folder: str, expected_hash: str, progress_callback: Callable = None, expected_size: int = 0) -> bool:
         """Download file in chunks with hash verification"""
         url_path = file_path.replace('\\', '/')
         url = f"{self.raw_url}/{url_path}"
-        local_path = os.path.join(data_folder, file_path)
-        temp_path = None  # Initialize to prevent UnboundLocalError in exception handler
         
         for attempt in range(3):
             try:
                 # Stream download
-                response = requests.get(url, stream=True, timeout=30)
+                response = self._session.get(url, stream=True, timeout=30)
                 if response.status_code != 200:
                     time.sleep(2)
                     continue
                 
-                total_size = int(response.headers.get('content-length', 0))
+                # Content-Length is the compressed size for gzip responses, so it can't be compared
+                # against the decoded bytes iter_content yields - prefer the manifest size
+                if expected_size:
+                    total_size = expected_size
+                elif response.headers.get('content-encoding'):
+                    total_size = 0
+                else:
+                    total_size = int(response.headers.get('content-length', 0))
                 downloaded = 0
                 
-                # Create temp file
-                Path(local_path).parent.mkdir(parents=True, exist_ok=True)
-                temp_path = local_path + '.tmp'
-                
-                # For Python files, we need to handle them specially
-                is_python_file = file_path.endswith('.py')
-                sha256_hash = hashlib.sha256() if not is_python_file else None
-                
-                with open(temp_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=self.chunk_size):
-                        if chunk:
-                            f.write(chunk)
-                            if not is_python_file:
-                                sha256_hash.update(chunk)
-                            downloaded += len(chunk)
-                            if progress_callback:
-                                progress_callback(downloaded, total_size)
+                # Stage the body in memory: it is verified straight from the buffer and written
+                # with a single open/write/close, and a corrupt download never touches the disk
+                content = bytearray()
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if chunk:
+                        content += chunk
+                        downloaded += len(chunk)
+                        if progress_callback:
+                            progress_callback(downloaded, total_size)
                 
                 # Verify hash if provided
-                if expected_hash:
-                    if is_python_file:
-                        # For Python files, normalize line endings before hashing
-                        try:
-                            with open(temp_path, 'r', encoding='utf-8', newline='') as f:
-                                content = f.read()
-                                content = content.replace('\r\n', '\n')
-                                actual_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()
-                        except:
-                            # Fallback to binary hash
-                            actual_hash = self._calculate_file_hash(temp_path)
-                    else:
-                        actual_hash = sha256_hash.hexdigest()
-                    
-                    if actual_hash != expected_hash:
-                        os.remove(temp_path)
-                        time.sleep(2)
-                        continue
-                
-                # Move temp file to final location
-                if os.path.exists(local_path):
-                    # Remove read-only attribute if present (so we can delete/replace)
-                    try:
-                        os.chmod(local_path, stat.S_IWRITE | stat.S_IREAD)
-                    except Exception as chmod_err:
-                        self._log(f"  Warning: Could not change permissions: {chmod_err}")
-                    try:
-                        os.remove(local_path)
-                    except Exception as remove_err:
-                        self._log(f"  ERROR: Could not remove existing file: {remove_err}")
-                        raise
-                os.rename(temp_path, local_path)
-                
-                # Make Python code files read-only for protection
-                if file_path.endswith('.py'):
-                    try:
-                        os.chmod(local_path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
-                    except:
-                        pass  # Not critical if this fails
+                if expected_hash and self._content_hash(file_path, content) != expected_hash:
+                    time.sleep(2)
+                    continue
                 
+                self._install_file(file_path, data_folder, content)
                 return True
             
             except Exception as e:
                 self._log(f"  Exception during download: {e}")
-                if temp_path and os.path.exists(temp_path):
-                    try:
-                        os.remove(temp_path)
-                    except:
-                        pass
                 if attempt < 2:
                     time.sleep(2)
         
         return False
     
+    def download_full_archive(self, progress_callback: Callable[[int, int, str, int, int], None] = None) -> bool:
+        """
+        First-run install from a single zipball of the branch instead of one request per file
+        
+        Only the files listed in the remote manifest (plus the config files) are extracted,
+        each verified against its manifest hash.
+        
+        Args:
+            progress_callback: Same signature as for download_updates; archive bytes are reported
+                under the archive name, extracted files with 0 bytes
+            
+        Returns:
+            True if every manifest file was installed, False otherwise (fall back to download_updates)
+        """
+        remote_manifest = self.prefetch_remote_manifest()
+        if not remote_manifest or not remote_manifest.get('files'):
+            return False
+        
+        # Archive-relative path -> expected hash
+        wanted = {}
+        for directory, files in remote_manifest['files'].items():
+            for file_name in files.keys():
+                file_path = file_name if directory == 'code' else f"{directory}/{file_name}"
+                wanted[file_path] = self._get_file_hash_from_manifest(remote_manifest, file_path)
+        config_files = ['update_config.json', 'toa_settings.json']
+        
+        data_folder = '.toa'
+        os.makedirs(data_folder, exist_ok=True)
+        archive_name = f"{self.repo_name}-{self.branch}.zip"
+        url = f"{self.base_url}/zipball/{self.branch}"
+        
+        try:
+            self._log(f"Downloading archive: {url}")
+            response = self._session.get(url, stream=True, timeout=30)
+            if response.status_code != 200:
+                self._log(f"  Archive request failed: HTTP {response.status_code}")
+                return False
+            
+            total_size = int(response.headers.get('content-length', 0))
+            downloaded = 0
+            # Keep the archive in memory - writing it to disk only to read it back doubles the I/O
+            archive_buffer = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if chunk:
+                    archive_buffer.write(chunk)
+                    downloaded += len(chunk)
+                    if progress_callback:
+                        progress_callback(0, len(wanted), archive_name, downloaded, total_size)
+            
+            installed = 0
+            with zipfile.ZipFile(archive_buffer) as archive:
+                for member in archive.infolist():
+                    if member.is_dir():
+                        continue
+                    # Strip GitHub's top-level "<owner>-<repo>-<sha>/" folder
+                    parts = member.filename.split('/', 1)
+                    if len(parts) != 2:
+                        continue
+                    file_path = parts[1]
+                    
+                    if file_path in wanted:
+                        content = archive.read(member)
+                        expected_hash = wanted[file_path]
+                        if expected_hash and self._content_hash(file_path, content) != expected_hash:
+                            self._log(f"  Hash mismatch in archive: {file_path}")
+                            return False
+                        self._install_file(file_path, data_folder, content)
+                        installed += 1
+                        if progress_callback:
+                            progress_callback(installed, len(wanted), file_path, 0, 0)
+                    elif file_path in config_files:
+                        self._install_file(file_path, data_folder, archive.read(member))
+            
+            if installed != len(wanted):
+                self._log(f"  Archive only contained {installed}/{len(wanted)} manifest files")
+                return False
+            
+            self._update_local_manifest(remote_manifest)
+            self._log("[OK] Installed from archive")
+            return True
+        
+        except Exception as e:
+            self._log(f"  Archive install failed: {e}")
+            return False
+    
     def _create_backup(self, files_to_backup: List[str]):
         """Create backup of files before updating"""
         try:
@@ -583,7 +863,7 @@ class AutoUpdater:
         try:
             local_version = self._get_local_version()
             version_url = f"{self.raw_url}/version.json"
-            response = requests.get(version_url, timeout=10)
+            response = self._session.get(version_url, timeout=10)
             response.raise_for_status()
             remote_version = json.loads(response.text)
             
@@ -665,6 +945,24 @@ class AutoUpdater:
         except Exception as e:
             print(f"Error repairing {file_path}: {e}")
             return False
+    
+    def repair_files(self, file_paths: List[str], data_folder: str = '.toa') -> Dict[str, bool]:
+        """
+        Redownload several corrupted/modified files concurrently over the shared session
+        
+        Args:
+            file_paths: Files to repair
+            data_folder: Folder the files live in
+            
+        Returns:
+            Dict mapping each file path to whether its repair succeeded
+        """
+        if not file_paths:
+            return {}
+        workers = min(self.max_download_workers, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(lambda file_path: self.repair_file(file_path, data_folder), file_paths)
+            return dict(zip(file_paths, results))
 
 
 def create_version_file(directories: List[str] = None, include_code: bool = True, output_file: str = "version.json"):
@@ -719,7 +1017,7 @@ def create_version_file(directories: List[str] = None, include_code: bool = True
                         try:
                             sha256_hash = hashlib.sha256()
                             with open(file_path, "rb") as f:
-                                for byte_block in iter(lambda: f.read(4096), b""):
+                                for byte_block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
                                     sha256_hash.update(byte_block)
                             file_hash = sha256_hash.hexdigest()
                             version_data['files'][directory][relative_path] = file_hash
@@ -736,7 +1034,7 @@ def create_version_file(directories: List[str] = None, include_code: bool = True
                 try:
                     sha256_hash = hashlib.sha256()
                     with open(code_file, "rb") as f:
-                        for byte_block in iter(lambda: f.read(4096), b""):
+                        for byte_block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
                             sha256_hash.update(byte_block)
                     file_hash = sha256_hash.hexdigest()
                     version_data['files']['code'][code_file] = file_hash
@@ -5,20 +5,27 @@ This launcher checks for and applies code updates before running the game.
 
 import os
 import sys
-import subprocess
 import json
 import time
+import queue
+import threading
 
 # Determine the actual directory where the exe/script is running from
 if getattr(sys, 'frozen', False):
     # Running as compiled exe - use the directory where exe is located
     application_path = os.path.dirname(sys.executable)
+    TOA_PATH = os.path.join(application_path, '.toa')
+    
+    # List .toa once and answer the startup existence checks from memory
+    try:
+        toa_entries = {entry.name for entry in os.scandir(TOA_PATH)}
+    except FileNotFoundError:
+        toa_entries = set()
     
     # Extract bundled config file to .toa folder if it doesn't exist
-    toa_folder = os.path.join(application_path, '.toa')
-    config_path = os.path.join(toa_folder, 'update_config.json')
-    if not os.path.exists(config_path):
-        os.makedirs(toa_folder, exist_ok=True)
+    config_path = os.path.join(TOA_PATH, 'update_config.json')
+    if 'update_config.json' not in toa_entries:
+        os.makedirs(TOA_PATH, exist_ok=True)
         import shutil
         bundled_config = os.path.join(sys._MEIPASS, 'update_config.json')
         if os.path.exists(bundled_config):
@@ -27,9 +34,80 @@ if getattr(sys, 'frozen', False):
 else:
     # Running as script - use script directory
     application_path = os.path.dirname(os.path.abspath(__file__))
+    TOA_PATH = os.path.join(application_path, '.toa')
+
+# Change to application directory and add to path FIRST (bootstrap.py has usually done it already)
+if os.getcwd() != application_path:
+    os.chdir(application_path)
+
+def prepend_sys_path(path):
+    """Move path to the front of sys.path without leaving a duplicate entry behind it"""
+    if path in sys.path:
+        sys.path.remove(path)
+    sys.path.insert(0, path)
 
-# Change to application directory and add to path FIRST
-os.chdir(application_path)
+# Passed when the launcher re-execs itself after an update so the child skips the network check
+SKIP_UPDATE_FLAG = '--skip-update-check'
+
+class DownloadProgress:
+    """Collects progress from the updater's download threads for the pygame loop to display"""
+    
+    def __init__(self, total_files, total_bytes):
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.files_done = 0
+        self.done_bytes = 0
+        self.current_file = ''
+        self.start_time = time.time()
+        self._file_bytes = {}
+        self._queue = queue.Queue()
+    
+    def callback(self, current, total, filename, file_downloaded, file_total):
+        """Progress callback for download_updates - runs on worker threads, so only enqueue"""
+        self._queue.put((current, filename, file_downloaded))
+    
+    def reset(self):
+        """Start over (e.g. when falling back to another download method) - thread-safe"""
+        self._queue.put(None)
+    
+    def drain(self):
+        """Apply queued progress updates (call from the pygame main thread), returns True if anything changed"""
+        changed = False
+        while True:
+            try:
+                update = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            changed = True
+            if update is None:
+                self.files_done = 0
+                self.done_bytes = 0
+                self._file_bytes.clear()
+                continue
+            current, filename, file_downloaded = update
+            self.files_done = max(self.files_done, current)
+            self.done_bytes += file_downloaded - self._file_bytes.get(filename, 0)
+            self._file_bytes[filename] = file_downloaded
+            self.current_file = filename or ''
+        return changed
+    
+    def fraction(self):
+        """Overall progress 0..1, by bytes when sizes are known, otherwise by file count"""
+        if self.total_bytes > 0:
+            return min(self.done_bytes / self.total_bytes, 1.0)
+        if self.total_files > 0:
+            return self.files_done / self.total_files
+        return 0
+    
+    def speed_text(self):
+        """Average download speed so far"""
+        elapsed = time.time() - self.start_time
+        if elapsed <= 0 or self.done_bytes <= 0:
+            return ""
+        speed = self.done_bytes / elapsed / 1024  # KB/s
+        if speed > 1024:
+            return f"{speed/1024:.1f} MB/s"
+        return f"{speed:.0f} KB/s"
 
 def show_installer_window(updater, all_files, is_first_run=True):
     """Show GUI installer window with download progress"""
@@ -49,91 +127,110 @@ def show_installer_window(updater, all_files, is_first_run=True):
     BLUE = (100, 150, 255)
     GRAY = (200, 200, 200)
     
-    # Calculate total size (rough estimate)
+    # Exact total size from the manifest so progress can be tracked in bytes
     total_files = len(all_files)
-    estimated_mb = total_files * 0.5  # Rough estimate
+    total_bytes = sum(updater.get_download_sizes(all_files).values())
+    progress = DownloadProgress(total_files, total_bytes)
     
-    downloaded = [0]  # Use list to allow modification in nested function
-    current_file_info = {'name': '', 'downloaded': 0, 'total': 0, 'start_time': 0}
-    import time
+    # Progress bar geometry
+    bar_width = 500
+    bar_height = 30
+    bar_x = 50
+    bar_y = 220
     
-    def progress_callback(current, total, filename, file_downloaded, file_total):
-        downloaded[0] = current
-        
-        # Update current file info
-        if filename != current_file_info['name']:
-            current_file_info['name'] = filename or ''
-            current_file_info['downloaded'] = 0
-            current_file_info['total'] = file_total
-            current_file_info['start_time'] = time.time()
-        else:
-            current_file_info['downloaded'] = file_downloaded
-            current_file_info['total'] = file_total
-        
-        # Draw window
-        screen.fill(WHITE)
+    # Static parts of the window (background, title, empty bar, status) rendered once
+    background = pygame.Surface((600, 400))
+    background.fill(WHITE)
+    title = "Installing TOA..." if is_first_run else "Updating TOA..."
+    title_text = font_large.render(title, True, BLACK)
+    background.blit(title_text, title_text.get_rect(center=(300, 60)))
+    pygame.draw.rect(background, GRAY, (bar_x, bar_y, bar_width, bar_height), border_radius=15)
+    status_text = font_small.render("Downloading from GitHub...", True, GRAY)
+    background.blit(status_text, status_text.get_rect(center=(300, 330)))
+    background = background.convert()
+    
+    # Full-width rounded fill, blitted cropped to the current progress instead of redrawing rounded rects
+    bar_fill = pygame.Surface((bar_width, bar_height), pygame.SRCALPHA)
+    pygame.draw.rect(bar_fill, BLUE, (0, 0, bar_width, bar_height), border_radius=15)
+    bar_fill = bar_fill.convert_alpha()
+    
+    # Download on a worker thread (the updater fetches files in parallel); pygame stays on this thread
+    result = {'success': False}
+    
+    def do_download():
+        if is_first_run:
+            # One zipball request instead of one request per file
+            result['success'] = updater.download_full_archive(progress_callback=progress.callback)
+            if result['success']:
+                return
+            progress.reset()
+        result['success'] = updater.download_updates(all_files, progress_callback=progress.callback, is_initial_download=is_first_run)
+    
+    download_thread = threading.Thread(target=do_download, daemon=True)
+    download_thread.start()
+    
+    # Only the progress text band and the bar change while downloading - repaint just those
+    text_area = pygame.Rect(0, 120, 600, 80)
+    bar_area = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
+    dirty_rects = [text_area, bar_area]
+    
+    # Last rendered surface per line; font.render only runs when the text actually changes
+    rendered_labels = {}
+    
+    def render_label(slot, font, label, color):
+        cached = rendered_labels.get(slot)
+        if cached is None or cached[0] != label:
+            cached = (label, font.render(label, True, color))
+            rendered_labels[slot] = cached
+        return cached[1]
+    
+    screen.blit(background, (0, 0))
+    pygame.display.flip()
+    
+    # Repaint at most 30 times a second and only when progress moved; chunk callbacks just queue data
+    first_frame = True
+    while download_thread.is_alive():
+        pygame.event.pump()  # Keep window responsive
+        clock.tick(30)
+        if not progress.drain() and not first_frame:
+            continue
+        first_frame = False
+        fraction = progress.fraction()
         
-        # Title
-        title = "Installing TOA..." if is_first_run else "Updating TOA..."
-        title_text = font_large.render(title, True, BLACK)
-        title_rect = title_text.get_rect(center=(300, 60))
-        screen.blit(title_text, title_rect)
+        # Restore the static background under the changing regions
+        screen.blit(background, text_area, text_area)
+        screen.blit(background, bar_area, bar_area)
         
         # Progress text
-        progress_text = font_medium.render(f"{current}/{total} files", True, BLACK)
+        if total_bytes > 0:
+            progress_label = f"{progress.files_done}/{total_files} files - {progress.done_bytes / 1024 / 1024:.1f}/{total_bytes / 1024 / 1024:.1f} MB"
+        else:
+            progress_label = f"{progress.files_done}/{total_files} files"
+        progress_text = render_label('progress', font_medium, progress_label, BLACK)
         progress_rect = progress_text.get_rect(center=(300, 140))
         screen.blit(progress_text, progress_rect)
         
-        # Current file progress
-        if file_total > 0:
-            file_mb = file_downloaded / 1024 / 1024
-            total_file_mb = file_total / 1024 / 1024
-            
-            # Calculate download speed
-            elapsed = time.time() - current_file_info['start_time']
-            speed_text = ""
-            if elapsed > 0 and file_downloaded > 0:
-                speed = file_downloaded / elapsed / 1024  # KB/s
-                if speed > 1024:
-                    speed_text = f" ({speed/1024:.1f} MB/s)"
-                else:
-                    speed_text = f" ({speed:.0f} KB/s)"
-            
-            file_text = font_small.render(f"{file_mb:.1f}/{total_file_mb:.1f} MB{speed_text}", True, GRAY)
+        # Download speed
+        speed_text = progress.speed_text()
+        if speed_text:
+            file_text = render_label('speed', font_small, speed_text, GRAY)
             file_rect = file_text.get_rect(center=(300, 180))
             screen.blit(file_text, file_rect)
         
-        # Progress bar
-        bar_width = 500
-        bar_height = 30
-        bar_x = 50
-        bar_y = 220
-        
-        # Background
-        pygame.draw.rect(screen, GRAY, (bar_x, bar_y, bar_width, bar_height), border_radius=15)
-        
-        # Fill
-        fill_width = int((current / total) * bar_width)
+        # Progress bar fill
+        fill_width = int(fraction * bar_width)
         if fill_width > 0:
-            pygame.draw.rect(screen, BLUE, (bar_x, bar_y, fill_width, bar_height), border_radius=15)
+            screen.blit(bar_fill, (bar_x, bar_y), (0, 0, fill_width, bar_height))
         
         # Percentage
-        percentage = int((current / total) * 100)
-        percent_text = font_small.render(f"{percentage}%", True, BLACK)
+        percentage = int(fraction * 100)
+        percent_text = render_label('percent', font_small, f"{percentage}%", BLACK)
         percent_rect = percent_text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
         screen.blit(percent_text, percent_rect)
         
-        # Status
-        status_text = font_small.render("Downloading from GitHub...", True, GRAY)
-        status_rect = status_text.get_rect(center=(300, 330))
-        screen.blit(status_text, status_rect)
-        
-        pygame.display.flip()
-        pygame.event.pump()  # Keep window responsive
-        clock.tick(60)
+        pygame.display.update(dirty_rects)
     
-    # Start download
-    success = updater.download_updates(all_files, progress_callback=progress_callback, is_initial_download=is_first_run)
+    success = result['success']
     
     if success:
         # Show completion message
@@ -147,36 +244,36 @@ def show_installer_window(updater, all_files, is_first_run=True):
         screen.blit(status_text, status_rect)
         
         pygame.display.flip()
-        pygame.time.wait(1000)
+        
+        # Leave the message up for a second (files are already synced to disk, nothing to wait for),
+        # but keep the window responsive and let a click or key press continue right away
+        deadline = pygame.time.get_ticks() + 1000
+        while pygame.time.get_ticks() < deadline:
+            if any(event.type in (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN) for event in pygame.event.get()):
+                break
+            clock.tick(30)
     
     pygame.quit()
     return success
 
-# Change to application directory and add to path FIRST
-os.chdir(application_path)
-
 # CRITICAL: When running as exe, check if launcher.py/auto_updater.py need to be downloaded to .toa
 if getattr(sys, 'frozen', False):
-    toa_path = os.path.join(application_path, '.toa')
-    launcher_in_toa = os.path.join(toa_path, 'launcher.py')
-    updater_in_toa = os.path.join(toa_path, 'auto_updater.py')
-    
     # If these files don't exist in .toa, extract from bundled versions
     # (They'll be updated later by the update system)
-    if not os.path.exists(launcher_in_toa) or not os.path.exists(updater_in_toa):
-        os.makedirs(toa_path, exist_ok=True)
+    if 'launcher.py' not in toa_entries or 'auto_updater.py' not in toa_entries:
+        os.makedirs(TOA_PATH, exist_ok=True)
         # The bundled versions will be used first time, then GitHub versions after
         # Note: This only happens on very first run - updates will replace these
     
-    # Always prioritize .toa folder for imports (where updates are stored)
-    if os.path.exists(toa_path):
-        sys.path.insert(0, toa_path)  # .toa folder has highest priority
-    sys.path.insert(0, application_path)
+    # Always prioritize .toa folder for imports (where updates are stored) - it exists by now
+    # bootstrap.py inserted the same two entries, so duplicates would make failed imports probe them twice
+    prepend_sys_path(TOA_PATH)  # .toa folder has highest priority
+    prepend_sys_path(application_path)
 else:
-    sys.path.insert(0, application_path)
+    prepend_sys_path(application_path)
 
-def check_and_update():
-    """Check for updates and download if available"""
+def load_updater():
+    """Load the update config and create the updater, returns (None, None) if auto-update is off"""
     try:
         from auto_updater import AutoUpdater
         import requests
@@ -190,11 +287,11 @@ def check_and_update():
             print(f"Config loaded. Enabled: {config.get('enabled', False)}")
         except Exception as e:
             print(f"Could not load update config: {e}")
-            return False
+            return None, None
         
         if not config.get('enabled', False):
             print("Auto-update is disabled in config")
-            return False
+            return None, None
         
         # Initialize updater
         updater = AutoUpdater(
@@ -202,28 +299,51 @@ def check_and_update():
             config.get('repository_name', ''),
             config.get('branch', 'main')
         )
-        
-        # Check if this is first run (no files downloaded yet)
-        if updater.is_first_run():
-            # Get all files from remote
-            all_files = updater.get_all_remote_files()
-            
-            if not all_files:
-                return False
-            
-            # Show GUI installer
-            success = show_installer_window(updater, all_files, is_first_run=True)
-            
-            # Hide .toa folder on Windows with system + hidden attributes
-            if sys.platform == 'win32':
-                import subprocess
-                toa_path = os.path.join(application_path, '.toa')
-                # Set as hidden + system to make it truly inaccessible
-                subprocess.run(['attrib', '+H', '+S', toa_path], shell=True, capture_output=True)
-            
-            return False  # Don't restart - this was initial download, not an update
-        
-        # Normal update check
+        return updater, config
+    
+    except ImportError:
+        print("Auto-update not available (missing dependencies)")
+        return None, None
+    except Exception as e:
+        print(f"Error during update check: {e}")
+        return None, None
+
+def install_game_files(updater):
+    """First run: download every game file through the GUI installer"""
+    # Get all files from remote - the manifest (sizes/hashes) and a connection to the
+    # archive host are fetched alongside instead of one after another
+    from concurrent.futures import ThreadPoolExecutor
+    # The warm-up is only an optimization, so nothing waits for it (daemon thread)
+    threading.Thread(target=updater.warm_up_connection, daemon=True).start()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        files_future = executor.submit(updater.get_all_remote_files)
+        executor.submit(updater.prefetch_remote_manifest)
+        all_files = files_future.result()
+    
+    if not all_files:
+        return False
+    
+    # Show GUI installer
+    success = show_installer_window(updater, all_files, is_first_run=True)
+    if success:
+        updater.mark_installed()
+    
+    # Hide .toa folder on Windows with system + hidden attributes
+    if sys.platform == 'win32':
+        import ctypes
+        # Set as hidden + system to make it truly inaccessible (direct API call, no attrib.exe/cmd.exe spawn)
+        FILE_ATTRIBUTE_HIDDEN = 0x02
+        FILE_ATTRIBUTE_SYSTEM = 0x04
+        try:
+            ctypes.windll.kernel32.SetFileAttributesW(ctypes.c_wchar_p(TOA_PATH), FILE_ATTRIBUTE_HIDDEN | FILE_ATTRIBUTE_SYSTEM)
+        except:
+            pass
+    
+    return success
+
+def find_updates(updater, config):
+    """Ask GitHub which files changed (network only, so it can run off the main thread)"""
+    try:
         print("Checking for updates...")
         directories = config.get('directories_to_sync', ['levels', 'beatmaps'])
         has_updates, files_to_update, update_info = updater.check_for_updates(directories, include_code=True)
@@ -231,227 +351,234 @@ def check_and_update():
         print(f"Update check result: has_updates={has_updates}, files_count={len(files_to_update)}")
         if update_info:
             print(f"Local: v{update_info.get('from_version', 'unknown')} -> Remote: v{update_info.get('to_version', 'unknown')}")
+        return has_updates and len(files_to_update) > 0, files_to_update, update_info
+    except Exception as e:
+        print(f"Error during update check: {e}")
+        return False, [], {}
+
+def show_update_window(updater, files_to_update, update_info):
+    """Confirm, install and report an update - returns True once new code is installed, exits otherwise"""
+    try:
+        # Show unified update window with confirmation, progress, and completion
+        remote_version = update_info.get('to_version', 'unknown')
+        update_size_mb = update_info.get('total_size', 0) / (1024 * 1024)
+        print(f"\nUpdate available: v{remote_version}")
+        print(f"Size: {update_size_mb:.1f} MB")
         
-        if has_updates and len(files_to_update) > 0:
-            # Show unified update window with confirmation, progress, and completion
-            remote_version = update_info.get('to_version', 'unknown')
-            update_size_mb = update_info.get('total_size', 0) / (1024 * 1024)
-            print(f"\nUpdate available: v{remote_version}")
-            print(f"Size: {update_size_mb:.1f} MB")
-            
-            import pygame
-            import time
-            pygame.init()
-            screen = pygame.display.set_mode((600, 400))
-            pygame.display.set_caption("Update Available")
-            font_title = pygame.font.Font(None, 42)
-            font_text = pygame.font.Font(None, 28)
-            font_button = pygame.font.Font(None, 32)
-            font_small = pygame.font.Font(None, 24)
-            clock = pygame.time.Clock()
-            
-            # State machine: 'confirm' -> 'installing' -> 'complete'
-            state = 'confirm'
-            user_confirmed = False
-            
-            # Progress tracking
-            downloaded = [0]
-            total_files = len(files_to_update)
-            current_file_info = {'name': '', 'downloaded': 0, 'total': 0, 'start_time': 0}
-            download_started = False  # Flag to prevent multiple thread spawns
+        import pygame
+        pygame.init()
+        screen = pygame.display.set_mode((600, 400))
+        pygame.display.set_caption("Update Available")
+        font_title = pygame.font.Font(None, 42)
+        font_text = pygame.font.Font(None, 28)
+        font_button = pygame.font.Font(None, 32)
+        font_small = pygame.font.Font(None, 24)
+        clock = pygame.time.Clock()
+        
+        # State machine: 'confirm' -> 'installing' -> 'complete'
+        state = 'confirm'
+        user_confirmed = False
+        
+        # Progress tracking (in bytes when the manifest provides sizes)
+        total_files = len(files_to_update)
+        progress = DownloadProgress(total_files, update_info.get('total_size', 0))
+        download_state = None
+        download_started = False  # Flag to prevent multiple thread spawns
+        
+        # Main loop
+        running = True
+        success = False
+        
+        while running:
+            mouse_pos = pygame.mouse.get_pos()
             
-            def progress_callback(current, total, filename, file_downloaded, file_total):
-                downloaded[0] = current
-                if filename != current_file_info['name']:
-                    current_file_info['name'] = filename or ''
-                    current_file_info['downloaded'] = 0
-                    current_file_info['total'] = file_total
-                    current_file_info['start_time'] = time.time()
-                else:
-                    current_file_info['downloaded'] = file_downloaded
-                    current_file_info['total'] = file_total
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    if state == 'confirm':
+                        # Check button clicks
+                        yes_button = pygame.Rect(150, 260, 120, 50)
+                        no_button = pygame.Rect(330, 260, 120, 50)
+                        if yes_button.collidepoint(mouse_pos):
+                            state = 'installing'
+                            user_confirmed = True
+                        elif no_button.collidepoint(mouse_pos):
+                            running = False
+                    elif state == 'complete':
+                        running = False
             
-            # Main loop
-            running = True
-            success = False
+            screen.fill((40, 40, 50))
             
-            while running:
-                mouse_pos = pygame.mouse.get_pos()
+            if state == 'confirm':
+                # Confirmation screen
+                title = font_title.render(f"Update v{remote_version} found", True, (100, 200, 255))
+                screen.blit(title, (600//2 - title.get_width()//2, 50))
                 
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        running = False
-                    if event.type == pygame.MOUSEBUTTONDOWN:
-                        if state == 'confirm':
-                            # Check button clicks
-                            yes_button = pygame.Rect(150, 260, 120, 50)
-                            no_button = pygame.Rect(330, 260, 120, 50)
-                            if yes_button.collidepoint(mouse_pos):
-                                state = 'installing'
-                                user_confirmed = True
-                            elif no_button.collidepoint(mouse_pos):
-                                running = False
-                        elif state == 'complete':
-                            running = False
+                # Show size
+                size_text = font_small.render(f"Size: {update_size_mb:.1f} MB", True, (200, 200, 200))
+                screen.blit(size_text, (600//2 - size_text.get_width()//2, 100))
                 
-                screen.fill((40, 40, 50))
+                msg = font_text.render("Install this update?", True, (255, 255, 255))
+                screen.blit(msg, (600//2 - msg.get_width()//2, 150))
                 
-                if state == 'confirm':
-                    # Confirmation screen
-                    title = font_title.render(f"Update v{remote_version} found", True, (100, 200, 255))
-                    screen.blit(title, (600//2 - title.get_width()//2, 50))
-                    
-                    # Show size
-                    size_text = font_small.render(f"Size: {update_size_mb:.1f} MB", True, (200, 200, 200))
-                    screen.blit(size_text, (600//2 - size_text.get_width()//2, 100))
-                    
-                    msg = font_text.render("Install this update?", True, (255, 255, 255))
-                    screen.blit(msg, (600//2 - msg.get_width()//2, 150))
-                    
-                    # Buttons
-                    yes_button = pygame.Rect(150, 260, 120, 50)
-                    no_button = pygame.Rect(330, 260, 120, 50)
-                    yes_hover = yes_button.collidepoint(mouse_pos)
-                    no_hover = no_button.collidepoint(mouse_pos)
-                    
-                    pygame.draw.rect(screen, (50, 200, 50) if yes_hover else (40, 150, 40), yes_button, border_radius=8)
-                    pygame.draw.rect(screen, (200, 50, 50) if no_hover else (150, 40, 40), no_button, border_radius=8)
-                    
-                    yes_text = font_button.render("Yes", True, (255, 255, 255))
-                    no_text = font_button.render("No", True, (255, 255, 255))
-                    screen.blit(yes_text, (yes_button.centerx - yes_text.get_width()//2, yes_button.centery - yes_text.get_height()//2))
-                    screen.blit(no_text, (no_button.centerx - no_text.get_width()//2, no_button.centery - no_text.get_height()//2))
+                # Buttons
+                yes_button = pygame.Rect(150, 260, 120, 50)
+                no_button = pygame.Rect(330, 260, 120, 50)
+                yes_hover = yes_button.collidepoint(mouse_pos)
+                no_hover = no_button.collidepoint(mouse_pos)
                 
-                elif state == 'installing':
-                    # Start download if not started
-                    if not download_started:
-                        download_started = True  # Set flag IMMEDIATELY to prevent duplicate threads
-                        # Trigger download in background
-                        import threading
-                        
-                        class DownloadState:
-                            def __init__(self):
-                                self.success = False
-                                self.done = False
-                        
-                        download_state = DownloadState()
-                        
-                        def do_download():
-                            download_state.success = updater.download_updates(files_to_update, progress_callback=progress_callback, is_initial_download=False)
-                            download_state.done = True
-                        
-                        download_thread = threading.Thread(target=do_download, daemon=True)
-                        download_thread.start()
-                        
-                        # Store state object so we can check it later
-                        current_file_info['download_state'] = download_state
-                    
-                    # Check if download is complete
-                    if 'download_state' in current_file_info and current_file_info['download_state'].done:
-                        state = 'complete'
-                        success = current_file_info['download_state'].success
-                    
-                    # Progress screen
-                    title = font_title.render("Installing Update...", True, (100, 200, 255))
-                    screen.blit(title, (600//2 - title.get_width()//2, 40))
+                pygame.draw.rect(screen, (50, 200, 50) if yes_hover else (40, 150, 40), yes_button, border_radius=8)
+                pygame.draw.rect(screen, (200, 50, 50) if no_hover else (150, 40, 40), no_button, border_radius=8)
+                
+                yes_text = font_button.render("Yes", True, (255, 255, 255))
+                no_text = font_button.render("No", True, (255, 255, 255))
+                screen.blit(yes_text, (yes_button.centerx - yes_text.get_width()//2, yes_button.centery - yes_text.get_height()//2))
+                screen.blit(no_text, (no_button.centerx - no_text.get_width()//2, no_button.centery - no_text.get_height()//2))
+            
+            elif state == 'installing':
+                # Start download if not started
+                if not download_started:
+                    download_started = True  # Set flag IMMEDIATELY to prevent duplicate threads
+                    # Trigger download in background
+                    class DownloadState:
+                        def __init__(self):
+                            self.success = False
+                            self.done = False
                     
-                    progress_text = font_text.render(f"{downloaded[0]}/{total_files} files", True, (255, 255, 255))
-                    screen.blit(progress_text, (600//2 - progress_text.get_width()//2, 100))
+                    download_state = DownloadState()
                     
-                    # Progress bar
-                    bar_width = 500
-                    bar_height = 30
-                    bar_x = 50
-                    bar_y = 180
-                    pygame.draw.rect(screen, (80, 80, 90), (bar_x, bar_y, bar_width, bar_height), border_radius=15)
-                    if total_files > 0:
-                        fill_width = int((downloaded[0] / total_files) * bar_width)
-                        if fill_width > 0:
-                            pygame.draw.rect(screen, (100, 200, 255), (bar_x, bar_y, fill_width, bar_height), border_radius=15)
-                        percentage = int((downloaded[0] / total_files) * 100)
-                        percent_text = font_small.render(f"{percentage}%", True, (255, 255, 255))
-                        screen.blit(percent_text, (bar_x + bar_width // 2 - percent_text.get_width()//2, bar_y + bar_height // 2 - percent_text.get_height()//2))
+                    def do_download():
+                        download_state.success = updater.download_updates(files_to_update, progress_callback=progress.callback, is_initial_download=False)
+                        download_state.done = True
                     
-                    # Current file
-                    if current_file_info['name']:
-                        file_text = font_small.render(current_file_info['name'], True, (200, 200, 200))
-                        screen.blit(file_text, (600//2 - file_text.get_width()//2, 240))
+                    download_thread = threading.Thread(target=do_download, daemon=True)
+                    download_thread.start()
                 
-                elif state == 'complete':
-                    # Completion screen
-                    if success:
-                        title = font_title.render("Install Complete!", True, (100, 255, 100))
-                        screen.blit(title, (600//2 - title.get_width()//2, 80))
-                        
-                        msg1 = font_text.render("Exit this window and rerun the exe", True, (255, 255, 255))
-                        msg2 = font_text.render("to start with the update.", True, (255, 255, 255))
-                        hint = font_small.render("(Click anywhere to exit)", True, (150, 150, 150))
-                        
-                        screen.blit(msg1, (600//2 - msg1.get_width()//2, 180))
-                        screen.blit(msg2, (600//2 - msg2.get_width()//2, 220))
-                        screen.blit(hint, (600//2 - hint.get_width()//2, 300))
-                    else:
-                        title = font_title.render("Update Failed", True, (255, 100, 100))
-                        screen.blit(title, (600//2 - title.get_width()//2, 150))
-                        hint = font_small.render("(Click to exit)", True, (150, 150, 150))
-                        screen.blit(hint, (600//2 - hint.get_width()//2, 250))
+                # Check if download is complete
+                if download_state.done:
+                    state = 'complete'
+                    success = download_state.success
                 
-                pygame.display.flip()
-                clock.tick(30)
-            
-            pygame.quit()
+                progress.drain()
+                
+                # Progress screen
+                title = font_title.render("Installing Update...", True, (100, 200, 255))
+                screen.blit(title, (600//2 - title.get_width()//2, 40))
+                
+                progress_text = font_text.render(f"{progress.files_done}/{total_files} files", True, (255, 255, 255))
+                screen.blit(progress_text, (600//2 - progress_text.get_width()//2, 100))
+                
+                # Progress bar
+                bar_width = 500
+                bar_height = 30
+                bar_x = 50
+                bar_y = 180
+                pygame.draw.rect(screen, (80, 80, 90), (bar_x, bar_y, bar_width, bar_height), border_radius=15)
+                fraction = progress.fraction()
+                if total_files > 0:
+                    fill_width = int(fraction * bar_width)
+                    if fill_width > 0:
+                        pygame.draw.rect(screen, (100, 200, 255), (bar_x, bar_y, fill_width, bar_height), border_radius=15)
+                    percentage = int(fraction * 100)
+                    percent_text = font_small.render(f"{percentage}%", True, (255, 255, 255))
+                    screen.blit(percent_text, (bar_x + bar_width // 2 - percent_text.get_width()//2, bar_y + bar_height // 2 - percent_text.get_height()//2))
+                
+                # Most recently active file
+                if progress.current_file:
+                    file_text = font_small.render(progress.current_file, True, (200, 200, 200))
+                    screen.blit(file_text, (600//2 - file_text.get_width()//2, 240))
             
-            if not user_confirmed:
-                print("Update declined by user. Exiting...")
-                sys.exit(0)
+            elif state == 'complete':
+                # Completion screen
+                if success:
+                    title = font_title.render("Install Complete!", True, (100, 255, 100))
+                    screen.blit(title, (600//2 - title.get_width()//2, 80))
+                    
+                    msg1 = font_text.render("TOA will now restart", True, (255, 255, 255))
+                    msg2 = font_text.render("to start with the update.", True, (255, 255, 255))
+                    hint = font_small.render("(Click anywhere to restart)", True, (150, 150, 150))
+                    
+                    screen.blit(msg1, (600//2 - msg1.get_width()//2, 180))
+                    screen.blit(msg2, (600//2 - msg2.get_width()//2, 220))
+                    screen.blit(hint, (600//2 - hint.get_width()//2, 300))
+                else:
+                    title = font_title.render("Update Failed", True, (255, 100, 100))
+                    screen.blit(title, (600//2 - title.get_width()//2, 150))
+                    hint = font_small.render("(Click to exit)", True, (150, 150, 150))
+                    screen.blit(hint, (600//2 - hint.get_width()//2, 250))
             
-            if success:
-                sys.exit(0)
-            else:
-                print("Update failed. Exiting...")
-                sys.exit(1)
+            pygame.display.flip()
+            clock.tick(30)
+        
+        pygame.quit()
+        
+        if not user_confirmed:
+            print("Update declined by user. Exiting...")
+            sys.exit(0)
+        
+        if success:
+            return True  # Code was updated - caller restarts the launcher
         else:
-            return False
-    
-    except ImportError:
-        print("Auto-update not available (missing dependencies)")
-        return False
+            print("Update failed. Exiting...")
+            sys.exit(1)
     except Exception as e:
-        print(f"Error during update check: {e}")
-        return False
+        # The dialog has taken over (or shut down) the game's display, so the game can't resume
+        print(f"Error during update: {e}")
+        sys.exit(1)
+
+def restart_launcher():
+    """Re-exec the launcher so the freshly downloaded code is loaded"""
+    print("Restarting to apply update...")
+    args = [arg for arg in sys.argv[1:] if arg != SKIP_UPDATE_FLAG]
+    args.append(SKIP_UPDATE_FLAG)
+    if getattr(sys, 'frozen', False):
+        # Make the onefile bootloader unpack fresh instead of reusing our soon-deleted temp dir
+        os.environ['PYINSTALLER_RESET_ENVIRONMENT'] = '1'
+        os.execv(sys.executable, [sys.executable] + args)
+    else:
+        main_script = os.path.abspath(sys.modules['__main__'].__file__)
+        os.execl(sys.executable, sys.executable, main_script, *args)
 
 def main():
     """Main launcher function"""
-    # CRITICAL: Pre-load pygame AND all its submodules FIRST before anything else when running as exe
-    # This must happen before check_and_update() to avoid DLL path issues
-    if getattr(sys, 'frozen', False):
-        try:
-            import pygame
-            import pygame.gfxdraw  # CRITICAL: Import submodule so it's available
-            pygame.init()  # Initialize pygame (including font system) while we have access to bundled resources
-            # Keep pygame in sys.modules so main.py can use it
-            print(f"Pre-loaded and initialized pygame from bundled location")
-        except Exception as e:
-            print(f"Warning: Could not pre-load pygame: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    # Check for updates (will exit if update is found and installed)
-    check_and_update()
+    # Check for updates - skipped when we were re-exec'd right after an update (the parent already checked)
+    update_check = None
+    game_files_installed = False
+    if SKIP_UPDATE_FLAG not in sys.argv:
+        updater, update_config = load_updater()
+        if updater is not None:
+            updater.migrate_install_marker()
+            if updater.is_first_run():
+                # Nothing to load yet - install the game files before going any further
+                install_game_files(updater)
+                game_files_installed = True
+            elif updater.checked_recently(update_config.get('check_interval_seconds', 900)):
+                # Up to date a few minutes ago - don't pay for the round-trip on a quick restart
+                print("Skipping update check (checked recently)")
+            else:
+                # Hide the network round-trips behind the loading screen, joined before the game loop
+                from concurrent.futures import ThreadPoolExecutor
+                update_executor = ThreadPoolExecutor(max_workers=1)
+                update_check = update_executor.submit(find_updates, updater, update_config)
+                update_executor.shutdown(wait=False)
     
-    # If we reach here, no updates or first run - continue to game
+    # Continue to game (a pending update check is collected after the loading screen)
     
     # CRITICAL: Remove any cached/bundled modules before importing
     # This ensures we load the downloaded files, not bundled ones
     # DO NOT remove pygame - we need to keep it loaded!
-    modules_to_reload = ['main', 'auto_updater', 'songpack_loader', 'songpack_ui']
-    for module in modules_to_reload:
-        if module in sys.modules:
+    # Only needed right after the first-run install: before it, imports fell back to the bundled
+    # copies; on every other start they already came from .toa (and updates re-exec the launcher).
+    # Script mode imports straight from the source tree, so there is nothing stale to drop
+    if getattr(sys, 'frozen', False) and game_files_installed:
+        modules_to_reload = {'main', 'auto_updater', 'songpack_loader', 'songpack_ui'}
+        for module in modules_to_reload & sys.modules.keys():
             del sys.modules[module]
-    
-    # Clear importlib caches to ensure fresh imports
-    import importlib
-    importlib.invalidate_caches()
+        
+        # Clear importlib caches to ensure fresh imports
+        import importlib
+        importlib.invalidate_caches()
     
     # Import and run the game
     print("Starting TOA...")
@@ -465,12 +592,23 @@ def main():
             if os.path.exists(toa_main_path):
                 import importlib.util
                 
-                # Read the main.py file content
-                with open(toa_main_path, 'r', encoding='utf-8') as f:
-                    main_code = f.read()
+                # Load pygame only now, after the update check was started - the installer/update
+                # windows import it themselves, so a normal start never pays for it before the check
+                import pygame
+                pygame.init()  # Initialize pygame (including font system) while we have access to bundled resources
+                
+                # Installs from before the updater compiled on download have no bytecode cache yet -
+                # build it once so SourceFileLoader loads main.py from __pycache__ from now on
+                main_source_path = os.path.abspath(toa_main_path)
+                if not os.path.exists(importlib.util.cache_from_source(main_source_path)):
+                    try:
+                        import py_compile
+                        py_compile.compile(main_source_path, doraise=True)
+                    except Exception as e:
+                        print(f"Warning: Could not compile main.py: {e}")
                 
                 # Create the module and inject bundled pygame before execution
-                spec = importlib.util.spec_from_file_location("main", os.path.abspath(toa_main_path))
+                spec = importlib.util.spec_from_file_location("main", main_source_path)
                 game_main = importlib.util.module_from_spec(spec)
                 
                 # CRITICAL: Inject bundled pygame into main's namespace BEFORE executing
@@ -505,6 +643,12 @@ def main():
                 print("Failed to load assets. Exiting...")
                 sys.exit()
             
+            # Collect the background update check (restarts the launcher if new code was installed)
+            if update_check is not None:
+                has_updates, files_to_update, update_info = update_check.result()
+                if has_updates and show_update_window(updater, files_to_update, update_info):
+                    restart_launcher()
+            
             returning = False
             restart_level = None
             while True:
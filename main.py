@@ -3,6 +3,12 @@ import os
 import time
 import math
 import json
+import functools
+import itertools
+import bisect
+from collections import deque
+import random
+from random import randint
 import subprocess
 import threading
 import warnings
@@ -37,6 +43,12 @@ except ImportError:
     AUTO_UPDATE_AVAILABLE = False
     print("Auto-update not available: requests library not installed")
 
+try:
+    import orjson  # Optional C parser - noticeably faster on the large level files
+    load_json_bytes = orjson.loads
+except ImportError:
+    load_json_bytes = json.loads  # Also accepts UTF-8 bytes
+
 __version__ = "0.8.1"
 
 # Settings management
@@ -123,6 +135,19 @@ def resource_path(relative_path):
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
+def get_display():
+    """Get the borderless fullscreen window, reusing the open one instead of recreating it"""
+    screen = pygame.display.get_surface()
+    if screen is None:
+        screen = pygame.display.set_mode((0, 0), pygame.NOFRAME)
+    return screen
+
+def fade_steps(duration, fps=60):
+    """Brightness (0 to 255 inclusive) for each frame of a fade-in at fps - fade-outs walk the list backwards"""
+    frames = max(1, round(duration * fps))
+    # frames + 1 steps so a fade-in ends at full brightness (and a fade-out at black)
+    return [255 * frame // frames for frame in range(frames + 1)]
+
 def fade_out(screen, duration=0.3):
     """Fade out the current screen to black"""
     if not game_settings.get('fade_effects', True):
@@ -131,51 +156,45 @@ def fade_out(screen, duration=0.3):
         return
         
     clock = pygame.time.Clock()
-    fade_surface = pygame.Surface(screen.get_size())
-    fade_surface.fill((0, 0, 0))
-
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        elapsed = time.time() - start_time
-        alpha = int(255 * (elapsed / duration))
-        fade_surface.set_alpha(alpha)
-        screen.blit(fade_surface, (0, 0))
+    saved_screen = screen.copy()
+
+    # Fixed frame count at 60 FPS (precomputed levels, no per-frame clock reads)
+    for brightness in reversed(fade_steps(duration)):
+        # Darken by multiplying the colors - one fill instead of alpha-blending a black overlay
+        screen.blit(saved_screen, (0, 0))
+        screen.fill((brightness, brightness, brightness), special_flags=pygame.BLEND_RGB_MULT)
         pygame.display.flip()
         clock.tick(60)
 
     # Ensure fully black at the end
-    fade_surface.set_alpha(255)
-    screen.blit(fade_surface, (0, 0))
+    screen.fill((0, 0, 0))
     pygame.display.flip()
 
-def fade_in(screen, content_func, duration=0.3):
+def fade_in(screen, content_func=None, duration=0.3, pre_rendered=None):
     """Fade in from black to the current screen
 
     Args:
         screen: pygame display surface
         content_func: Function that draws the content (takes screen as argument)
         duration: Duration of fade in seconds
+        pre_rendered: Surface holding the finished content - blitted instead of calling content_func every frame
     """
-    if not game_settings.get('fade_effects', True):
+    if pre_rendered is None:
+        # Draw the content once; the fade itself is then a blit and a fill per frame
         content_func(screen)
+        pre_rendered = screen.copy()
+
+    if not game_settings.get('fade_effects', True):
+        screen.blit(pre_rendered, (0, 0))
         pygame.display.flip()
         return
         
     clock = pygame.time.Clock()
-    fade_surface = pygame.Surface(screen.get_size())
-    fade_surface.fill((0, 0, 0))
 
-    start_time = time.time()
-    while time.time() - start_time < duration:
-        elapsed = time.time() - start_time
-        alpha = int(255 * (1 - elapsed / duration))
-
-        # Draw the content
-        content_func(screen)
-
-        # Draw fading black overlay
-        fade_surface.set_alpha(alpha)
-        screen.blit(fade_surface, (0, 0))
+    for brightness in fade_steps(duration):
+        # Brighten the content by multiplying its colors
+        screen.blit(pre_rendered, (0, 0))
+        screen.fill((brightness, brightness, brightness), special_flags=pygame.BLEND_RGB_MULT)
         pygame.display.flip()
         clock.tick(60)
 
@@ -236,6 +255,14 @@ def show_loading_screen():
     BLACK = (0, 0, 0)
     BLUE = (100, 150, 255)
     GREEN = (112, 255, 148)
+    RED = (255, 100, 100)
+
+    def describe_files(file_names, limit=3):
+        """Short one-line list of file names: the first few, then a count of the rest"""
+        shown = ', '.join(file_names[:limit])
+        if len(file_names) > limit:
+            shown += f" and {len(file_names) - limit} more"
+        return shown
 
     # Start with black screen
     screen.fill(BLACK)
@@ -283,24 +310,18 @@ def show_loading_screen():
         pygame.display.flip()
         clock.tick(60)
 
-    # Fade in the loading screen
-    fade_surface = pygame.Surface((window_width, window_height))
-    fade_surface.fill((0, 0, 0))
+    # Fade in the loading screen (11 frames at 60 FPS, rendered once and faded with the shared helper)
     if game_settings.get('fade_effects', True):
-        for alpha in range(255, 0, -25):
-            screen.fill(BLACK)
-            title_text = font_title.render("TOA", True, WHITE)
-            title_rect = title_text.get_rect(center=(window_width // 2, window_height // 2 - 100))
-            screen.blit(title_text, title_rect)
+        screen.fill(BLACK)
+        title_text = font_title.render("TOA", True, WHITE)
+        title_rect = title_text.get_rect(center=(window_width // 2, window_height // 2 - 100))
+        screen.blit(title_text, title_rect)
 
-            status_text = font_status.render("Loading...", True, WHITE)
-            status_rect = status_text.get_rect(center=(window_width // 2, window_height // 2 + 50))
-            screen.blit(status_text, status_rect)
+        status_text = font_status.render("Loading...", True, WHITE)
+        status_rect = status_text.get_rect(center=(window_width // 2, window_height // 2 + 50))
+        screen.blit(status_text, status_rect)
 
-            fade_surface.set_alpha(alpha)
-            screen.blit(fade_surface, (0, 0))
-            pygame.display.flip()
-            clock.tick(60)
+        fade_in(screen, duration=11 / 60, pre_rendered=screen.copy())
     
     # Preload all songpacks and convert levels
     update_loading_screen("Scanning song packs...")
@@ -334,70 +355,150 @@ def show_loading_screen():
                 safe_name = re.sub(r'[^\w\s-]', '', level_info['name']).strip().replace(' ', '_')
                 valid_level_names.add(safe_name)
     
+    def read_level_metadata(json_path):
+        """Parse one level JSON into the lightweight metadata the menus need (None if invalid)"""
+        try:
+            with open(json_path, 'rb') as f:
+                data = load_json_bytes(f.read())
+                meta = data.get('meta', {})
+                
+                # Skip if missing required fields (old/invalid JSON)
+                if not meta.get('title') or not meta.get('audio_file'):
+                    return None
+                level_notes = data.get('level', [])
+                
+                # Calculate NPS range
+                notes_by_second = {}
+                for note in level_notes:
+                    second = int(note.get('t', 0))
+                    notes_by_second[second] = notes_by_second.get(second, 0) + 1
+                nps_min = min(notes_by_second.values()) if notes_by_second else None
+                nps_max = max(notes_by_second.values()) if notes_by_second else None
+                
+                # Store lightweight metadata
+                return {
+                    'title': meta.get('title', 'Unknown'),
+                    'version': meta.get('version', 'Unknown'),
+                    'artist': meta.get('artist', 'Unknown'),
+                    'creator': meta.get('creator', 'Unknown'),
+                    'note_count': len(level_notes),
+                    'bpm_min': meta.get('bpm_min'),
+                    'bpm_max': meta.get('bpm_max'),
+                    'background_file': meta.get('background_file'),
+                    'length': meta.get('length'),
+                    'nps_min': nps_min,
+                    'nps_max': nps_max
+                }
+        except Exception as e:
+            print(f"Error caching metadata for {json_path}: {e}")
+            return None
+    
     if packs:
         total_levels = sum(len(pack['levels']) for pack in packs)
         converted_count = 0
+        all_level_jsons = []
+        # List the levels folder once instead of once per level (new conversions report their own files)
+        level_dir_files = sorted(file for file in os.listdir(levels_dir) if file.endswith('.json'))
         
-        for pack in packs:
-            pack_name = pack['pack_name']
-            for level_info in pack['levels']:
-                # Check if already converted
-                import re
-                safe_name = re.sub(r'[^\w\s-]', '', level_info['name']).strip().replace(' ', '_')
-                existing_jsons = []
-                if os.path.exists(levels_dir):
-                    for file in os.listdir(levels_dir):
-                        if file.startswith(safe_name) and file.endswith('.json'):
-                            existing_jsons.append(os.path.join(levels_dir, file))
-                
-                # Convert if not already done
-                if not existing_jsons:
-                    progress = converted_count / total_levels if total_levels > 0 else 0
-                    update_loading_screen(f"Loading {pack_name}: {level_info['name']}", progress)
-                    try:
-                        created_jsons = convert_level_to_json(level_info, output_dir=levels_dir)
-                        existing_jsons.extend(created_jsons)
-                    except Exception as e:
-                        print(f"Error converting {level_info['name']}: {e}")
-                
-                # Cache metadata for all JSONs
-                for json_path in existing_jsons:
-                    try:
-                        with open(json_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                            meta = data.get('meta', {})
-                            
-                            # Skip if missing required fields (old/invalid JSON)
-                            if not meta.get('title') or not meta.get('audio_file'):
-                                continue
-                            level_notes = data.get('level', [])
-                            
-                            # Calculate NPS range
-                            notes_by_second = {}
-                            for note in level_notes:
-                                second = int(note.get('t', 0))
-                                notes_by_second[second] = notes_by_second.get(second, 0) + 1
-                            nps_min = min(notes_by_second.values()) if notes_by_second else None
-                            nps_max = max(notes_by_second.values()) if notes_by_second else None
-                            
-                            # Store lightweight metadata
-                            level_metadata_cache[json_path] = {
-                                'title': meta.get('title', 'Unknown'),
-                                'version': meta.get('version', 'Unknown'),
-                                'artist': meta.get('artist', 'Unknown'),
-                                'creator': meta.get('creator', 'Unknown'),
-                                'note_count': len(level_notes),
-                                'bpm_min': meta.get('bpm_min'),
-                                'bpm_max': meta.get('bpm_max'),
-                                'background_file': meta.get('background_file'),
-                                'length': meta.get('length'),
-                                'nps_min': nps_min,
-                                'nps_max': nps_max
-                            }
-                    except Exception as e:
-                        print(f"Error caching metadata for {json_path}: {e}")
-                
-                converted_count += 1
+        # Conversion and metadata parsing run on a worker thread so the main thread can keep the
+        # loading screen animating (all pygame drawing stays on the main thread)
+        load_state = {'status': "Loading levels...", 'progress': 0.0, 'error': None}
+        
+        def prepare_levels():
+            # stderr is silenced, so a crash here would otherwise just end the thread and
+            # leave the level list half filled - hand it to the main thread instead
+            try:
+                load_levels()
+            except Exception as e:
+                load_state['error'] = e
+        
+        def load_levels():
+            nonlocal converted_count
+            for pack in packs:
+                pack_name = pack['pack_name']
+                for level_info in pack['levels']:
+                    # Check if already converted
+                    import re
+                    safe_name = re.sub(r'[^\w\s-]', '', level_info['name']).strip().replace(' ', '_')
+                    existing_jsons = [os.path.join(levels_dir, file) for file in level_dir_files if file.startswith(safe_name)]
+                    
+                    # Convert if not already done
+                    if not existing_jsons:
+                        load_state['status'] = f"Loading {pack_name}: {level_info['name']}"
+                        load_state['progress'] = converted_count / total_levels if total_levels > 0 else 0
+                        try:
+                            created_jsons = convert_level_to_json(level_info, output_dir=levels_dir)
+                            existing_jsons.extend(created_jsons)
+                        except Exception as e:
+                            print(f"Error converting {level_info['name']}: {e}")
+                    
+                    # Metadata is read for all of them at once below
+                    all_level_jsons.extend(existing_jsons)
+                    
+                    converted_count += 1
+                    load_state['progress'] = converted_count / total_levels
+            
+            # Metadata parsed on earlier launches, keyed by path and validated by (mtime, size).
+            # Not a .json name so the level scans never mistake it for a level
+            index_path = os.path.join(levels_dir, '.metadata_index')
+            try:
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    metadata_index = json.load(f)
+            except Exception:
+                metadata_index = {}
+            if not isinstance(metadata_index, dict):
+                metadata_index = {}
+            
+            level_stats = {}
+            stale_jsons = []
+            for json_path in dict.fromkeys(all_level_jsons):
+                try:
+                    st = os.stat(json_path)
+                except OSError:
+                    continue
+                level_stats[json_path] = [st.st_mtime, st.st_size]
+                # Anything but a well-formed entry for the current (mtime, size) is re-parsed
+                entry = metadata_index.get(json_path)
+                if (not isinstance(entry, dict) or entry.get('stat') != level_stats[json_path]
+                        or 'meta' not in entry
+                        or not (entry['meta'] is None or isinstance(entry['meta'], dict))):
+                    stale_jsons.append(json_path)
+            
+            # Read and parse new/changed level files on a small thread pool - the file reads overlap
+            # instead of queueing behind each other
+            if stale_jsons:
+                load_state['status'] = "Reading levels..."
+                load_state['progress'] = 1.0
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=5) as executor:
+                    for json_path, metadata in zip(stale_jsons, executor.map(read_level_metadata, stale_jsons)):
+                        metadata_index[json_path] = {'stat': level_stats[json_path], 'meta': metadata}
+            
+            # Results are stored in the original order
+            for json_path in level_stats:
+                metadata = metadata_index[json_path]['meta']
+                if metadata is not None:
+                    level_metadata_cache[json_path] = metadata
+            
+            # Rewrite the index when something changed (drops levels that no longer exist)
+            if stale_jsons or len(metadata_index) != len(level_stats):
+                try:
+                    with open(index_path, 'w', encoding='utf-8') as f:
+                        json.dump({json_path: metadata_index[json_path] for json_path in level_stats}, f)
+                except Exception as e:
+                    print(f"Could not write level metadata index: {e}")
+        
+        level_loader = threading.Thread(target=prepare_levels, daemon=True)
+        level_loader.start()
+        shown_progress = 0.0
+        while level_loader.is_alive():
+            pygame.event.pump()
+            # Ease the bar toward the worker's progress so it glides between levels instead of jumping
+            shown_progress += (load_state['progress'] - shown_progress) * 0.2
+            update_loading_screen(load_state['status'], shown_progress)
+        level_loader.join()
+        if load_state['error'] is not None:
+            raise load_state['error']
         
         update_loading_screen("Loading complete!", 1.0)
         pygame.time.wait(500)  # Brief pause to show completion
@@ -445,23 +546,49 @@ def show_loading_screen():
                 
                 # Auto-repair if needed
                 if corrupted_files:
-                    for i, file in enumerate(corrupted_files):
+                    screen.fill(BLACK)
+                    title_text = font_title.render("TOA TESTING", True, WHITE)
+                    title_rect = title_text.get_rect(center=(window_width // 2, window_height // 2 - 100))
+                    screen.blit(title_text, title_rect)
+                    
+                    status_text = font_status.render("Repairing files...", True, WHITE)
+                    status_rect = status_text.get_rect(center=(window_width // 2, window_height // 2 + 20))
+                    screen.blit(status_text, status_rect)
+                    
+                    progress_text = font_small.render(f"({len(corrupted_files)}) {describe_files(corrupted_files)}", True, GREEN)
+                    progress_rect = progress_text.get_rect(center=(window_width // 2, window_height // 2 + 60))
+                    screen.blit(progress_text, progress_rect)
+                    
+                    pygame.display.flip()
+                    
+                    # All downloads in flight at once over the updater's keep-alive pool
+                    repair_results = updater.repair_files(corrupted_files)
+                    failed_files = [path for path, ok in repair_results.items() if not ok]
+                    
+                    if failed_files:
+                        # Don't start the game on files that are still corrupted
                         screen.fill(BLACK)
                         title_text = font_title.render("TOA TESTING", True, WHITE)
                         title_rect = title_text.get_rect(center=(window_width // 2, window_height // 2 - 100))
                         screen.blit(title_text, title_rect)
                         
-                        status_text = font_status.render("Repairing files...", True, WHITE)
+                        status_text = font_status.render("Could not restore game files", True, RED)
                         status_rect = status_text.get_rect(center=(window_width // 2, window_height // 2 + 20))
                         screen.blit(status_text, status_rect)
                         
-                        progress_text = font_small.render(f"({i+1}/{len(corrupted_files)}) {file}", True, GREEN)
-                        progress_rect = progress_text.get_rect(center=(window_width // 2, window_height // 2 + 60))
-                        screen.blit(progress_text, progress_rect)
+                        failed_text = font_small.render(f"({len(failed_files)}) {describe_files(failed_files)}", True, RED)
+                        failed_rect = failed_text.get_rect(center=(window_width // 2, window_height // 2 + 60))
+                        screen.blit(failed_text, failed_rect)
                         
-                        pygame.display.flip()
+                        hint_text = font_small.render("Check your internet connection and restart TOA", True, WHITE)
+                        hint_rect = hint_text.get_rect(center=(window_width // 2, window_height // 2 + 100))
+                        screen.blit(hint_text, hint_rect)
                         
-                        updater.repair_file(file)
+                        pygame.display.flip()
+                        print(f"File repair failed for: {', '.join(failed_files)}")
+                        pygame.time.wait(4000)
+                        pygame.quit()
+                        sys.exit(1)
                     
                     # Show completion
                     screen.fill(BLACK)
@@ -511,7 +638,7 @@ def show_main_menu(fade_in_start=False):
     Returns: 'LEVELS' or 'SONGPACKS' or None/QUIT
     """
     pygame.init()
-    screen = pygame.display.set_mode((0, 0), pygame.NOFRAME)
+    screen = get_display()
     pygame.display.set_caption("TOA - Main Menu")
     window_width, window_height = screen.get_size()
     clock = pygame.time.Clock()
@@ -607,6 +734,22 @@ def show_main_menu(fade_in_start=False):
     
     return selected
 
+@functools.lru_cache(maxsize=8)
+def get_item_gradient(width, height, max_alpha=200):
+    """Black (left) to transparent (right) overlay for list items, built once per size"""
+    # One pixel row, stretched vertically - every row of the gradient is identical
+    row = pygame.Surface((width, 1), pygame.SRCALPHA)
+    for x in range(width):
+        row.set_at((x, 0), (0, 0, 0, int(max_alpha * (1 - x / width))))
+    return pygame.transform.scale(row, (width, height))
+
+@functools.lru_cache(maxsize=32)
+def get_hover_overlay(width, height, alpha_step):
+    """Rounded dark hover overlay for list items, alpha quantized to 16 steps (0-15 -> 0-100 alpha)"""
+    overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(overlay, (0, 0, 0, alpha_step * 100 // 15), (0, 0, width, height), border_radius=15)
+    return overlay
+
 def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
     """Show popup window to select a level
 
@@ -637,34 +780,37 @@ def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
             print("Error: No level files found!")
             return None
 
+        # Index the first background image of every beatmap folder in one pass
+        bg_index = {}
+        try:
+            image_extensions = ('.jpg', '.jpeg', '.png', '.bmp')
+            for beatmap_entry in os.scandir(resource_path("beatmaps")):
+                if beatmap_entry.is_dir():
+                    for file_entry in os.scandir(beatmap_entry.path):
+                        if file_entry.name.lower().endswith(image_extensions):
+                            bg_index[beatmap_entry.name] = file_entry.path
+                            break
+        except OSError:
+            pass
+
         level_metadata = []
         for level_file in level_files:
             try:
-                with open(resource_path(os.path.join(levels_dir, level_file)), 'r') as f:
-                    data = json.load(f)
+                with open(resource_path(os.path.join(levels_dir, level_file)), 'rb') as f:
+                    data = load_json_bytes(f.read())
                     title = data.get('meta', {}).get('title', 'Unknown')
                     version = data.get('meta', {}).get('version', 'Unknown')
                     artist = data.get('meta', {}).get('artist', 'Unknown')
                     creator = data.get('meta', {}).get('creator', 'Unknown')
                     beatmap_name = level_file.replace('.json', '').split('_')[0]
-                    beatmap_dir = f"beatmaps/{beatmap_name}"
-                    bg_image = None
-                    try:
-                        if os.path.exists(resource_path(beatmap_dir)):
-                            image_extensions = ['.jpg', '.jpeg', '.png', '.bmp']
-                            for file in os.listdir(resource_path(beatmap_dir)):
-                                if any(file.lower().endswith(ext) for ext in image_extensions):
-                                    bg_path = os.path.join(beatmap_dir, file)
-                                    bg_image = pygame.image.load(resource_path(bg_path))
-                                    break
-                    except:
-                        bg_image = None
-                    level_metadata.append((level_file, title, version, artist, creator, bg_image))
+                    # Only the path - images are decoded lazily when the item scrolls into view
+                    bg_path = bg_index.get(beatmap_name)
+                    level_metadata.append((level_file, title, version, artist, creator, bg_path))
             except:
                 level_metadata.append((level_file, level_file.replace('.json', ''), '', 'Unknown', 'Unknown', None))
 
-    # Window setup - fullscreen borderless
-    screen = pygame.display.set_mode((0, 0), pygame.NOFRAME)
+    # Window setup - fullscreen borderless (reuses the open window)
+    screen = get_display()
     pygame.display.set_caption(f"TOA - Select Level")
     pygame.mouse.set_visible(True)  # Show mouse in level selector
     window_width, window_height = screen.get_size()
@@ -698,6 +844,97 @@ def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
     scrollbar_dragging = False
     drag_start_y = 0
     drag_start_scroll = 0
+
+    # Rounded-corner alpha mask shared by every item (all items are the same size)
+    rounded_mask = pygame.Surface((window_width - 100, item_height - 5), pygame.SRCALPHA)
+    pygame.draw.rect(rounded_mask, (255, 255, 255, 255), rounded_mask.get_rect(), border_radius=15)
+
+    def compose_item_background(bg_image, rect_width, rect_height):
+        """Cover-scale, center-crop, round and shade a level background into one surface"""
+        # Calculate scaling to cover the rect while maintaining aspect ratio
+        bg_width, bg_height = bg_image.get_size()
+        scale = max(rect_width / bg_width, rect_height / bg_height)  # Cover mode - use larger scale
+
+        # Center crop in source pixels first, so only the visible region is converted and scaled
+        src_width = min(bg_width, max(1, round(rect_width / scale)))
+        src_height = min(bg_height, max(1, round(rect_height / scale)))
+        src_rect = pygame.Rect((bg_width - src_width) // 2, (bg_height - src_height) // 2, src_width, src_height)
+        # Bilinear scaling; convert first - smoothscale needs 24/32-bit
+        cropped_bg = pygame.transform.smoothscale(bg_image.subsurface(src_rect).convert(), (rect_width, rect_height))
+
+        # Apply rounded corners using the shared mask
+        composed = pygame.Surface((rect_width, rect_height), pygame.SRCALPHA)
+        composed.blit(cropped_bg, (0, 0))
+        composed.blit(rounded_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+
+        # Black to transparent gradient overlay (left to right)
+        composed.blit(get_item_gradient(rect_width, rect_height), (0, 0))
+        return composed.convert_alpha()
+
+    # Composed backgrounds of recently visible items (LRU, bounded RAM). Images are decoded on a
+    # worker thread; composing (convert/blits) happens on the main thread once a decode arrives
+    from collections import OrderedDict
+    from concurrent.futures import ThreadPoolExecutor
+    import queue
+    composed_backgrounds = OrderedDict()
+    max_cached_backgrounds = 20
+    pending_backgrounds = set()
+    failed_backgrounds = set()
+    decoded_backgrounds = queue.Queue()
+    bg_loader = ThreadPoolExecutor(max_workers=1)
+    # Items [first, last) on screen, updated every frame; decodes and composes are limited to
+    # items within bg_visible_margin of it so a fast scroll doesn't queue up every item it passed
+    visible_items = [0, 0]
+    bg_visible_margin = 2
+    skipped_decode = object()  # Queued in place of an image when an item scrolled away before decoding
+
+    def near_visible(i):
+        return visible_items[0] - bg_visible_margin <= i < visible_items[1] + bg_visible_margin
+
+    def decode_background(i, bg_path):
+        if not near_visible(i):
+            decoded_backgrounds.put((i, skipped_decode))
+            return
+        try:
+            decoded_backgrounds.put((i, pygame.image.load(bg_path)))
+        except Exception as e:
+            print(f"Could not load background {bg_path}: {e}")
+            decoded_backgrounds.put((i, None))
+
+    def get_item_background(i, bg_path):
+        """Composed background for item i, or None while it is still loading"""
+        composed = composed_backgrounds.get(i)
+        if composed is not None:
+            composed_backgrounds.move_to_end(i)
+        elif i not in pending_backgrounds and i not in failed_backgrounds:
+            pending_backgrounds.add(i)
+            bg_loader.submit(decode_background, i, bg_path)
+        return composed
+
+    # Static chrome (background, title, ESC hint, scrollbar track) rendered once
+    static_bg = pygame.Surface((window_width, window_height)).convert()
+    static_bg.fill((0, 0, 0))
+    title_text = font_title.render("Select a Level", True, WHITE)
+    static_bg.blit(title_text, title_text.get_rect(center=(window_width // 2, 55)))
+    esc_text = font_hint.render("Press ESC for Settings", True, (200, 200, 200))
+    static_bg.blit(esc_text, esc_text.get_rect(center=(window_width // 2, window_height - 60)))
+    if total_content_height > available_height:
+        track_rect = pygame.Rect(window_width - 35, list_start_y, 20, list_end_y - list_start_y)
+        pygame.draw.rect(static_bg, WHITE, track_rect, border_radius=5)
+
+    # "Showing X-Y of N" hint, re-rendered only when the visible range changes
+    hint_cache = {'range': None, 'surface': None}
+
+    # Item titles/versions/artists never change - render each string once per font and color
+    item_text_cache = {}
+
+    def get_item_text(font, text, color):
+        """Get or create cached text surface for a list item"""
+        key = (id(font), text, color)
+        surface = item_text_cache.get(key)
+        if surface is None:
+            surface = item_text_cache[key] = font.render(text, True, color)
+        return surface
     
     # Track mouse down position for drag scrolling
     mouse_down_pos = None
@@ -714,11 +951,36 @@ def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
     # We'll render once first, then fade in at the end of the first frame
     first_frame = True
 
+    # Frames are only redrawn when something visible changed (events, scrolling, hover animation)
+    needs_redraw = True
+    drawn_scroll_offset = None
+
+    # Cursor is only switched on hover transitions, not every frame
+    current_cursor = pygame.SYSTEM_CURSOR_ARROW
+    pygame.mouse.set_cursor(current_cursor)
+
     while selected_level is None:
         mouse_pos = pygame.mouse.get_pos()
         mouse_x, mouse_y = mouse_pos
 
+        # Compose backgrounds that finished decoding, evicting the least recently drawn ones.
+        # Items that scrolled away meanwhile are dropped (and requested again if they come back)
+        # so they neither stall this frame nor push visible items out of the cache
+        while not decoded_backgrounds.empty():
+            i, bg_image = decoded_backgrounds.get_nowait()
+            pending_backgrounds.discard(i)
+            if bg_image is None:
+                failed_backgrounds.add(i)
+                continue
+            if bg_image is skipped_decode or not near_visible(i):
+                continue
+            composed_backgrounds[i] = compose_item_background(bg_image, window_width - 100, item_height - 5)
+            while len(composed_backgrounds) > max_cached_backgrounds:
+                composed_backgrounds.popitem(last=False)
+            needs_redraw = True
+
         for event in pygame.event.get():
+            needs_redraw = True
             if event.type == pygame.QUIT:
                 selected_level = "QUIT"
                 break
@@ -733,6 +995,7 @@ def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
                     # If result is 'BACK' or None, just continue
                     # Reload scroll speed in case it changed
                     scroll_speed = game_settings.get('scroll_speed', 75)
+                    current_cursor = None  # Settings menu may have changed the cursor
                 elif event.key == pygame.K_UP:
                     scroll_velocity -= scroll_speed * 2  # Add velocity in up direction
                 elif event.key == pygame.K_DOWN:
@@ -842,24 +1105,19 @@ def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
             scroll_offset = max_scroll
             scroll_velocity *= -0.3  # Bounce effect
 
-        # Rendering
-        screen.fill((0, 0, 0))
-
-        # Draw title
-        title_text = font_title.render("Select a Level", True, WHITE)
-        title_rect = title_text.get_rect(center=(window_width // 2, 55))
-        screen.blit(title_text, title_rect)
-
         # Draw level list
         list_start_y = 100
         hovered_index = None
+        hover_changed = False
+
+        # Only the items inside the viewport are updated and drawn
+        first_visible = max(0, int(scroll_offset // item_height))
+        last_visible = min(len(level_metadata), int((scroll_offset + available_height) // item_height) + 1)
+        visible_items[0], visible_items[1] = first_visible, last_visible
 
         # Update hover animations
-        for i in range(len(level_metadata)):
+        for i in range(first_visible, last_visible):
             item_y = list_start_y + (i * item_height) - scroll_offset
-            # Only check items that are visible in the viewport
-            if item_y + item_height < list_start_y or item_y > list_end_y:
-                continue
             item_rect = pygame.Rect(50, item_y, window_width - 100, item_height - 5)
 
             # Check if mouse is hovering (but not during drag)
@@ -871,34 +1129,49 @@ def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
                     hovered_index = i
 
             # Update hover animation for this item
-            if i not in hover_animations:
-                hover_animations[i] = 0.0
+            previous_progress = hover_animations.get(i, 0.0)
 
             if is_hovered:
                 # Ease in - increase animation progress
-                hover_animations[i] = min(1.0, hover_animations[i] + hover_speed)
+                hover_animations[i] = min(1.0, previous_progress + hover_speed)
             else:
                 # Fade out quickly
-                hover_animations[i] = max(0.0, hover_animations[i] - hover_speed * 2)
+                hover_animations[i] = max(0.0, previous_progress - hover_speed * 2)
+
+            if hover_animations[i] != previous_progress:
+                hover_changed = True
+
+        # Forget finished and scrolled-away animations so the dict doesn't grow with the list
+        hover_animations = {i: progress for i, progress in hover_animations.items()
+                            if progress > 0.0 and first_visible - 2 <= i <= last_visible + 2}
 
         # Set cursor based on whether hovering over any item (not during drag)
         if hovered_index is not None and not item_dragging:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND)
+            desired_cursor = pygame.SYSTEM_CURSOR_HAND
         else:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+            desired_cursor = pygame.SYSTEM_CURSOR_ARROW
+        if desired_cursor != current_cursor:
+            pygame.mouse.set_cursor(desired_cursor)
+            current_cursor = desired_cursor
+
+        # Idle menu: nothing moved, so the last frame is still on screen
+        if not needs_redraw and not hover_changed and scroll_offset == drawn_scroll_offset:
+            clock.tick(60)
+            continue
+        needs_redraw = False
+        drawn_scroll_offset = scroll_offset
+
+        # Rendering - background, title, ESC hint and scrollbar track come pre-rendered
+        screen.blit(static_bg, (0, 0))
 
         # Set clipping rect to constrain items to viewport
         viewport_rect = pygame.Rect(0, list_start_y, window_width, list_end_y - list_start_y)
         screen.set_clip(viewport_rect)
 
         # Draw items
-        for i in range(len(level_metadata)):
+        for i in range(first_visible, last_visible):
             item_y = list_start_y + (i * item_height) - scroll_offset
 
-            # Skip items that are not visible in the viewport
-            if item_y + item_height < list_start_y or item_y > list_end_y:
-                continue
-
             # Keep float position for smooth rendering, create rect for collision only
             item_x = 50
             rect_width = window_width - 100
@@ -912,54 +1185,19 @@ def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
             eased_progress = hover_progress * hover_progress  # Quadratic ease-in
 
             # Get metadata
-            level_file, title, version, artist, creator, bg_image = level_metadata[i]
-
-            # Draw background image if available (cover + center positioning)
-            if bg_image is not None:
-                # Calculate scaling to cover the rect while maintaining aspect ratio
-                bg_width, bg_height = bg_image.get_size()
-
-                scale_x = rect_width / bg_width
-                scale_y = rect_height / bg_height
-                scale = max(scale_x, scale_y)  # Cover mode - use larger scale
-
-                new_width = int(bg_width * scale)
-                new_height = int(bg_height * scale)
-
-                # Scale the image
-                scaled_bg = pygame.transform.scale(bg_image, (new_width, new_height))
+            level_file, title, version, artist, creator, bg_path = level_metadata[i]
+            has_background = bg_path is not None and i not in failed_backgrounds
 
-                # Center crop
-                crop_x = (new_width - rect_width) // 2
-                crop_y = (new_height - rect_height) // 2
-                cropped_bg = scaled_bg.subsurface(pygame.Rect(crop_x, crop_y, rect_width, rect_height))
-
-                # Create a rounded surface for the background
-                bg_surface = pygame.Surface((rect_width, rect_height), pygame.SRCALPHA)
-                bg_surface.blit(cropped_bg, (0, 0))
-
-                # Apply rounded corners using a mask
-                mask_surface = pygame.Surface((rect_width, rect_height), pygame.SRCALPHA)
-                pygame.draw.rect(mask_surface, (255, 255, 255, 255), (0, 0, rect_width, rect_height), border_radius=15)
-                bg_surface.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-
-                screen.blit(bg_surface, (item_x, item_y))
-
-                # Draw black to transparent gradient overlay (left to right)
-                gradient_surface = pygame.Surface((rect_width, rect_height), pygame.SRCALPHA)
-                for x in range(rect_width):
-                    # Gradient from black (left) to transparent (right)
-                    alpha = int(200 * (1 - x / rect_width))  # 200 max opacity at left, 0 at right
-                    pygame.draw.line(gradient_surface, (0, 0, 0, alpha), (x, 0), (x, rect_height))
-
-                screen.blit(gradient_surface, (item_x, item_y))
+            # Draw the composed background (cover-cropped, rounded, gradient-shaded) once it has loaded
+            if has_background:
+                composed_bg = get_item_background(i, bg_path)
+                if composed_bg is not None:
+                    screen.blit(composed_bg, (item_x, item_y))
 
                 # Draw hover overlay with animation (dark overlay)
-                if eased_progress > 0.0:
-                    hover_alpha = int(100 * eased_progress)
-                    hover_overlay = pygame.Surface((rect_width, rect_height), pygame.SRCALPHA)
-                    pygame.draw.rect(hover_overlay, (0, 0, 0, hover_alpha), (0, 0, rect_width, rect_height), border_radius=15)
-                    screen.blit(hover_overlay, (item_x, item_y))
+                alpha_step = int(eased_progress * 15)
+                if alpha_step > 0:
+                    screen.blit(get_hover_overlay(rect_width, rect_height, alpha_step), (item_x, item_y))
             else:
                 # No background image - draw solid color background with hover animation
                 GRAY = (200, 200, 200)
@@ -985,24 +1223,24 @@ def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
 
             text_start_y = item_y + (rect_height - total_text_height) // 2
 
-            text_color = (255, 255, 255) if bg_image is not None else (0, 0, 0)
-            title_text = font_item_title.render(title, True, text_color)
+            text_color = (255, 255, 255) if has_background else (0, 0, 0)
+            title_text = get_item_text(font_item_title, title, text_color)
             screen.blit(title_text, (item_x + 30, text_start_y))
 
             current_y = text_start_y + 40
 
             if version:
-                version_text = font_item_version.render(f"[{version}]", True, text_color)
+                version_text = get_item_text(font_item_version, f"[{version}]", text_color)
                 screen.blit(version_text, (item_x + 30, current_y))
                 current_y += 30
 
             if artist and artist != 'Unknown':
-                artist_text = font_hint.render(f"Artist: {artist}", True, text_color)
+                artist_text = get_item_text(font_hint, f"Artist: {artist}", text_color)
                 screen.blit(artist_text, (item_x + 30, current_y))
                 current_y += 25
 
             if creator and creator != 'Unknown':
-                creator_text = font_hint.render(f"Mapped by: {creator}", True, text_color)
+                creator_text = get_item_text(font_hint, f"Mapped by: {creator}", text_color)
                 screen.blit(creator_text, (item_x + 30, current_y))
 
         # Remove clipping rect after drawing items
@@ -1015,10 +1253,6 @@ def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
             scrollbar_width = 20
             scrollbar_track_height = list_end_y - list_start_y
 
-            # Draw scrollbar track
-            track_rect = pygame.Rect(scrollbar_x, scrollbar_y, scrollbar_width, scrollbar_track_height)
-            pygame.draw.rect(screen, WHITE, track_rect, border_radius=5)
-
             # Calculate scrollbar thumb size and position
             thumb_height = max(30, int((available_height / total_content_height) * scrollbar_track_height))
             thumb_y = scrollbar_y + int((scroll_offset / max_scroll) * (scrollbar_track_height - thumb_height)) if max_scroll > 0 else scrollbar_y
@@ -1031,14 +1265,13 @@ def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
         if total_content_height > available_height:
             visible_start = int(scroll_offset / item_height) + 1
             visible_end = min(len(level_metadata), int((scroll_offset + available_height) / item_height) + 1)
-            hint_text = font_hint.render(f"Showing {visible_start}-{visible_end} of {len(level_metadata)} | Scroll or use Arrow Keys", True, (200, 200, 200))
+            if hint_cache['range'] != (visible_start, visible_end):
+                hint_cache['range'] = (visible_start, visible_end)
+                hint_cache['surface'] = font_hint.render(f"Showing {visible_start}-{visible_end} of {len(level_metadata)} | Scroll or use Arrow Keys", True, (200, 200, 200))
+            hint_text = hint_cache['surface']
             hint_rect = hint_text.get_rect(center=(window_width // 2, window_height - 30))
             screen.blit(hint_text, hint_rect)
 
-        esc_text = font_hint.render("Press ESC for Settings", True, (200, 200, 200))
-        esc_rect = esc_text.get_rect(center=(window_width // 2, window_height - 60))
-        screen.blit(esc_text, esc_rect)
-
         # Draw UPDATE TEST in center over everything
         # font_update_test = pygame.font.Font(None, 120)
         # update_test_text = font_update_test.render("UPDATE TEST", True, (160, 32, 240))
@@ -1051,26 +1284,15 @@ def show_level_select_popup(fade_in_start=False, preloaded_metadata=None):
             pygame.display.flip()
 
             if game_settings.get('fade_effects', True):
-                fade_surface = pygame.Surface((window_width, window_height))
-                fade_surface.fill((0, 0, 0))
-                fade_start_time = time.time()
                 fade_duration = 0.5 if not fade_in_start else 0.7
-
-                saved_screen = screen.copy()
-
-                while time.time() - fade_start_time < fade_duration:
-                    elapsed = time.time() - fade_start_time
-                    alpha = int(255 * (1 - elapsed / fade_duration))
-
-                    screen.blit(saved_screen, (0, 0))
-                    fade_surface.set_alpha(alpha)
-                    screen.blit(fade_surface, (0, 0))
-                    pygame.display.flip()
-                    clock.tick(60)
+                fade_in(screen, duration=fade_duration, pre_rendered=screen.copy())
 
         pygame.display.flip()
         clock.tick(60)
 
+    # Queued decodes are for this menu only - don't let them run on into gameplay
+    bg_loader.shutdown(wait=False, cancel_futures=True)
+
     if selected_level == "QUIT":
         return None
 
@@ -1657,9 +1879,16 @@ def show_autoplay_popup():
         draw_autoplay_content(screen)
         pygame.display.flip()
 
+    # The popup is static: it was drawn above, so it is only repainted when the window is exposed
     result = None
     while result is None:
+        # Wait for the frame first so the event queue is pumped once per frame
+        clock.tick(60)
+
         for event in pygame.event.get():
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                draw_autoplay_content(screen)
+                pygame.display.flip()
             if event.type == pygame.QUIT:
                 result = False
                 break
@@ -1674,13 +1903,6 @@ def show_autoplay_popup():
                     result = 'BACK'
                     break
 
-        if result is not None:
-            break
-
-        draw_autoplay_content(screen)
-        pygame.display.flip()
-        clock.tick(60)
-
     if game_settings.get('fade_effects', True):
         fade_out(screen, duration=0.3)
     return result
@@ -1812,8 +2034,8 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     if audio_dir is None:
         # First check if the level JSON has audio_file metadata (from song packs)
         try:
-            with open(level_json, 'r', encoding='utf-8') as f:
-                level_data = json.load(f)
+            with open(level_json, 'rb') as f:
+                level_data = load_json_bytes(f.read())
                 audio_file_path = level_data.get('meta', {}).get('audio_file')
                 
                 if audio_file_path:
@@ -1855,7 +2077,7 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     # Scroll direction setting: 'down' = tiles spawn top, fall down; 'up' = spawn bottom, rise up
     scroll_direction = game_settings.get('scroll_direction', 'down')
 
-    screen = pygame.display.set_mode((0, 0), pygame.NOFRAME)
+    screen = get_display()
     pygame.display.set_caption(f"TOA")
     pygame.mouse.set_visible(True)
 
@@ -1888,13 +2110,16 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     input_flashes = {}
 
     # ===== Particle system for hit effects =====
-    particles = []  # [(x, y, vx, vy, color, size, birth_time)]
+    # Fixed-capacity ring buffer in birth order: the oldest particles fall off the front,
+    # either when they expire or when a burst would overflow the buffer
+    MAX_PARTICLES = 512
+    particles = deque(maxlen=MAX_PARTICLES)  # [(x, y, vx, vy, color, size, birth_time)]
     
-    # Hit glow effects
-    hit_glows = []  # [(box_idx, start_time, intensity)]
+    # Hit glow effects (birth order, expired from the front)
+    hit_glows = deque()  # [(box_idx, start_time, intensity)]
     
-    # Impact waves (expanding circles)
-    impact_waves = []  # [(x, y, start_time, color)]
+    # Impact waves (expanding circles, birth order, expired from the front)
+    impact_waves = deque()  # [(x, y, start_time, color)]
     
     # Screen flash for perfect hits
     screen_flash_time = 0
@@ -1905,7 +2130,11 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     dot_pulse_times = {}  # {dot_idx: start_time} for individual pulse animations
     dot_switch_ripples = []  # [(dot_idx, start_time)]
 
-    game_start_time = time.time()
+    # Gameplay timing uses the monotonic clock so system clock adjustments can't skew it
+    game_start_time = time.monotonic()
+    # Frame timestamp, refreshed at the top of each frame and after input handling; the
+    # judgment, shake, hit-effect and health helpers stamp their animations with it
+    now = game_start_time
     current_event_index = 0
     score = 0
     total_hits = 0
@@ -1919,16 +2148,60 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     else:
         level_path = resource_path(level_json)
     
-    with open(level_path, "r") as f:
-        level_data = json.load(f)
+    with open(level_path, "rb") as f:
+        level_data = load_json_bytes(f.read())
+
+    # List the beatmap folder once; the audio, hitsound and background searches all filter
+    # this listing in memory (lowercase lookup, since Windows file names are case-insensitive)
+    audio_dir_path = audio_dir if os.path.isabs(audio_dir) else resource_path(audio_dir)
+    try:
+        audio_dir_files = os.listdir(audio_dir_path)
+    except OSError:
+        audio_dir_files = []
+    audio_dir_lookup = {file.lower(): file for file in audio_dir_files}
+
+    # Decode the beatmap hitsounds and read the background image on a worker thread while the
+    # chart, box images and music are prepared here; converting/scaling stays on the main thread
+    preloaded_assets = {'hitsounds': {}, 'bg_meta_image': None, 'bg_file': None, 'bg_file_image': None}
+
+    def preload_level_assets():
+        for sound_name in ['normal', 'whistle', 'finish', 'clap']:
+            for prefix in ['normal', 'soft', 'drum']:
+                for ext in ['.wav', '.ogg', '.mp3', '.flac', '.aac', '.m4a']:
+                    sound_file = audio_dir_lookup.get(f"{prefix}-hit{sound_name}{ext}")
+                    if sound_file:
+                        try:
+                            preloaded_assets['hitsounds'][sound_name] = pygame.mixer.Sound(os.path.join(audio_dir_path, sound_file))
+                        except Exception as e:
+                            print(f"Could not load hitsound {sound_file}: {e}")
+                        break
+                if sound_name in preloaded_assets['hitsounds']:
+                    break
+
+        try:
+            # Song packs name their background in the level metadata
+            bg_file_from_meta = level_data.get('meta', {}).get('background_file')
+            if bg_file_from_meta:
+                check_bg = bg_file_from_meta if os.path.isabs(bg_file_from_meta) else resource_path(bg_file_from_meta)
+                if os.path.exists(check_bg):
+                    preloaded_assets['bg_meta_image'] = pygame.image.load(check_bg)
+            # Otherwise fall back to the first image in the beatmap folder
+            if preloaded_assets['bg_meta_image'] is None:
+                for file in audio_dir_files:
+                    if file.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
+                        preloaded_assets['bg_file'] = file
+                        preloaded_assets['bg_file_image'] = pygame.image.load(os.path.join(audio_dir_path, file))
+                        break
+        except Exception as e:
+            print(f"Could not load beatmap background: {e}")
+
+    preload_thread = threading.Thread(target=preload_level_assets, daemon=True)
+    preload_thread.start()
 
     level = []
     for event in level_data["level"]:
-        hitsound_data = {
-            'whistle': event.get('whistle', False),
-            'finish': event.get('finish', False),
-            'clap': event.get('clap', False)
-        }
+        # Hitsound flags packed into one int: whistle=1, finish=2, clap=4
+        hitsound_data = (1 if event.get('whistle') else 0) | (2 if event.get('finish') else 0) | (4 if event.get('clap') else 0)
         level.append((event["t"], event["box"], event["color"], hitsound_data))
 
     # Calculate optimal approach duration to prevent tile overlap
@@ -1994,15 +2267,16 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
         # OSU charts need the standard 3 second offset
         level = [(t + 3.0, box, color, hs) for t, box, color, hs in level]
 
-    target_box = None
-    target_color = None
-    target_time = None
-    target_hitsound = None
+    # Parallel per-field lists so the main loop can binary-search due events by time
+    ev_times = [t for t, _, _, _ in level]
+    ev_boxes = [box for _, box, _, _ in level]
+    ev_colors = [color for _, _, color, _ in level]
+    level_count = len(level)
 
     # Track approach indicators - list of (box_index, color, target_time, approach_duration, event_index, side)
     approach_indicators = []
-    # Track fading tiles for missed notes - list of (box_index, color, x, y, start_time)
-    fading_tiles = []
+    # Track fading tiles for missed notes - deque of (box_index, color, x, y, start_time) in start order
+    fading_tiles = deque()
 
     # Load and scale box image
     box_image = pygame.image.load(resource_path("assets/box.jpg")).convert()
@@ -2024,7 +2298,7 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     osu_audio_filename = None
     try:
         # Check if audio_dir is absolute or relative
-        check_dir = audio_dir if os.path.isabs(audio_dir) else resource_path(audio_dir)
+        check_dir = audio_dir_path
         
         # Try to find the .osu file matching the level
         level_base = os.path.splitext(os.path.basename(level_json))[0]
@@ -2035,7 +2309,7 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
             base_name = level_base
         # Find .osu file in audio_dir that matches base_name
         osu_file = None
-        for file in os.listdir(check_dir):
+        for file in audio_dir_files:
             if file.lower().endswith('.osu') and base_name.lower() in file.lower():
                 osu_file = os.path.join(audio_dir, file)
                 break
@@ -2052,13 +2326,12 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
         if osu_audio_filename:
             candidate = os.path.join(audio_dir, osu_audio_filename)
             check_candidate = candidate if os.path.isabs(candidate) else resource_path(candidate)
-            if os.path.exists(check_candidate):
+            if osu_audio_filename.lower() in audio_dir_lookup or os.path.exists(check_candidate):
                 audio_path = candidate
         # Fallback: search for any audio file
         if audio_path is None:
-            files = os.listdir(check_dir)
             for ext in audio_extensions:
-                for file in files:
+                for file in audio_dir_files:
                     if file.lower().endswith(ext):
                         audio_path = os.path.join(audio_dir, file)
                         break
@@ -2092,9 +2365,11 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
         print(f"Attempted to load from: {full_audio_path}")
     music_start_time = None
 
+    # Pick up the hitsounds and background decoded by the worker thread
+    preload_thread.join()
+
     # Load hitsounds
     hitsounds = {}
-    hitsound_extensions = ['.wav', '.ogg', '.mp3', '.flac', '.aac', '.m4a']
     
     # Load default hitsound from assets
     default_hitsound = None
@@ -2108,17 +2383,8 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     
     try:
         for sound_name in ['normal', 'whistle', 'finish', 'clap']:
-            sound = None
-            # Try to load from beatmap folder first
-            for prefix in ['normal', 'soft', 'drum']:
-                for ext in hitsound_extensions:
-                    sound_file = f"{prefix}-hit{sound_name}{ext}"
-                    sound_path = os.path.join(audio_dir, sound_file)
-                    if os.path.exists(resource_path(sound_path)):
-                        sound = pygame.mixer.Sound(resource_path(sound_path))
-                        break
-                if sound:
-                    break
+            # Use the beatmap folder's hitsound first (decoded by the worker thread)
+            sound = preloaded_assets['hitsounds'].get(sound_name)
             
             # If not found, use default hitsound from assets
             if sound is None and default_hitsound is not None:
@@ -2140,75 +2406,106 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
             sound.set_volume(game_settings.get('hitsound_volume', 0.3))
             hitsounds[sound_name] = sound
 
+    # Reserve dedicated channels for hitsounds and cycle through them, so a hit plays
+    # straight onto the next channel instead of Sound.play() scanning for a free one
+    HITSOUND_CHANNEL_COUNT = 8
+    pygame.mixer.set_reserved(HITSOUND_CHANNEL_COUNT)
+    hitsound_channels = itertools.cycle([pygame.mixer.Channel(i) for i in range(HITSOUND_CHANNEL_COUNT)])
+
+    def play_hitsound(sound_name='normal'):
+        next(hitsound_channels).play(hitsounds[sound_name])
+
     # Load beatmap background image if available
     beatmap_bg_image = None
     gameplay_bg_image = None  # Full screen background for gameplay
     
     try:
         # First check if level JSON has a background_file in metadata (from song packs)
-        bg_file_from_meta = level_data.get('meta', {}).get('background_file')
-        
-        if bg_file_from_meta:
-            # Check if path is absolute
-            check_bg = bg_file_from_meta if os.path.isabs(bg_file_from_meta) else resource_path(bg_file_from_meta)
-            if os.path.exists(check_bg):
-                # Load the BG.png from song pack
-                gameplay_bg = pygame.image.load(check_bg)
-                # Scale to full screen
-                gameplay_bg_image = pygame.transform.scale(gameplay_bg, (screen_width, screen_height))
-                # Create dark overlay
+        if preloaded_assets['bg_meta_image'] is not None:
+            # The BG.png from song pack (display format, so the per-frame blit is a plain copy)
+            gameplay_bg = preloaded_assets['bg_meta_image'].convert()
+            # Scale to full screen
+            gameplay_bg_image = pygame.transform.smoothscale(gameplay_bg, (screen_width, screen_height))
+            # Create dark overlay
+            dark_overlay = pygame.Surface((screen_width, screen_height))
+            dark_overlay.set_alpha(180)  # Adjust darkness (0-255)
+            dark_overlay.fill((0, 0, 0))
+            # Apply overlay to gameplay background
+            gameplay_bg_image.blit(dark_overlay, (0, 0))
+            
+            # Also use for small thumbnail
+            beatmap_bg_image = pygame.transform.smoothscale(gameplay_bg, (200, 150))
+        
+        if beatmap_bg_image is None and preloaded_assets['bg_file_image'] is not None:
+            # Fallback to the first image found in audio_dir
+            file = preloaded_assets['bg_file']
+            bg_img = preloaded_assets['bg_file_image'].convert()
+            
+            # Check if this is BG.png (for full screen gameplay background)
+            if file.lower().startswith('bg'):
+                gameplay_bg = bg_img.copy()
+                gameplay_bg_image = pygame.transform.smoothscale(gameplay_bg, (screen_width, screen_height))
                 dark_overlay = pygame.Surface((screen_width, screen_height))
-                dark_overlay.set_alpha(180)  # Adjust darkness (0-255)
+                dark_overlay.set_alpha(180)
                 dark_overlay.fill((0, 0, 0))
-                # Apply overlay to gameplay background
                 gameplay_bg_image.blit(dark_overlay, (0, 0))
-                
-                # Also use for small thumbnail
-                beatmap_bg_image = pygame.transform.scale(gameplay_bg, (200, 150))
-        
-        if beatmap_bg_image is None:
-            # Fallback to finding images in audio_dir
-            check_dir = audio_dir if os.path.isabs(audio_dir) else resource_path(audio_dir)
-            for file in os.listdir(check_dir):
-                if file.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
-                    bg_path = os.path.join(audio_dir, file)
-                    check_bg_path = bg_path if os.path.isabs(bg_path) else resource_path(bg_path)
-                    bg_img = pygame.image.load(check_bg_path)
-                    
-                    # Check if this is BG.png (for full screen gameplay background)
-                    if file.lower().startswith('bg'):
-                        gameplay_bg = bg_img.copy()
-                        gameplay_bg_image = pygame.transform.scale(gameplay_bg, (screen_width, screen_height))
-                        dark_overlay = pygame.Surface((screen_width, screen_height))
-                        dark_overlay.set_alpha(180)
-                        dark_overlay.fill((0, 0, 0))
-                        gameplay_bg_image.blit(dark_overlay, (0, 0))
-                    
-                    # Create thumbnail version
-                    original_width, original_height = bg_img.get_size()
-                    target_height = 150
-                    aspect_ratio = original_width / original_height
-                    target_width = int(target_height * aspect_ratio)
-                    beatmap_bg_image = pygame.transform.scale(bg_img, (target_width, target_height))
-                    break
+            
+            # Create thumbnail version
+            original_width, original_height = bg_img.get_size()
+            target_height = 150
+            aspect_ratio = original_width / original_height
+            target_width = int(target_height * aspect_ratio)
+            beatmap_bg_image = pygame.transform.smoothscale(bg_img, (target_width, target_height))
     except Exception as e:
         print(f"Could not load beatmap background: {e}")
         beatmap_bg_image = None
         gameplay_bg_image = None
 
-    def create_rounded_image(image, radius):
+    # All box variants are square_size, so one rounded-corner mask is shared between them
+    rounded_mask = pygame.Surface((square_size, square_size), pygame.SRCALPHA)
+    pygame.draw.rect(rounded_mask, (255, 255, 255, 255), (0, 0, square_size, square_size), 0, 8)
+
+    def create_rounded_image(image):
         """Create an image with rounded corners"""
-        size = image.get_size()
-        rounded_image = pygame.Surface(size, pygame.SRCALPHA)
-        rounded_image.blit(image, (0, 0))
-        mask = pygame.Surface(size, pygame.SRCALPHA)
-        pygame.draw.rect(mask, (255, 255, 255, 255), (0, 0, size[0], size[1]), 0, radius)
-        rounded_image.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
-        return rounded_image.convert_alpha()
-
-    box_image_rounded = create_rounded_image(box_image, 8)
-    box_red_rounded = create_rounded_image(box_red_image, 8)
-    box_blue_rounded = create_rounded_image(box_blue_image, 8)
+        rounded_image = image.convert_alpha()
+        rounded_image.blit(rounded_mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+        return rounded_image
+
+    box_image_rounded = create_rounded_image(box_image)
+    box_red_rounded = create_rounded_image(box_red_image)
+    box_blue_rounded = create_rounded_image(box_blue_image)
+    # Colored flash overlay per note color, looked up directly instead of compared per flash
+    box_overlays = {'red': box_red_rounded, 'blue': box_blue_rounded}
+    # Edge-flash RGB per note color
+    edge_flash_colors = {'red': (255, 0, 0), 'blue': (0, 0, 255)}
+
+    # Approach indicator tiles: one opaque template per color, plus copies at each alpha in use
+    indicator_size = 60  # Original size restored
+    # The rounded border and fill shapes are rasterized once in white and tinted per color
+    indicator_border_mask = pygame.Surface((indicator_size, indicator_size), pygame.SRCALPHA)
+    pygame.draw.rect(indicator_border_mask, (255, 255, 255, 255), (0, 0, indicator_size, indicator_size), 0, 8)
+    indicator_fill_mask = pygame.Surface((indicator_size, indicator_size), pygame.SRCALPHA)
+    # Fill slightly smaller to create border effect
+    pygame.draw.rect(indicator_fill_mask, (255, 255, 255, 255), (3, 3, indicator_size - 6, indicator_size - 6), 0, 6)
+    indicator_templates = {}
+    for note_color, indicator_color, border_color in (('red', (255, 0, 0), (255, 255, 255)),    # White border for red
+                                                      ('blue', (0, 0, 255), (255, 215, 0))):    # Yellow border for blue
+        indicator_surface = indicator_border_mask.copy()
+        indicator_surface.fill((*border_color, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        indicator_fill = indicator_fill_mask.copy()
+        indicator_fill.fill((*indicator_color, 255), special_flags=pygame.BLEND_RGBA_MULT)
+        indicator_surface.blit(indicator_fill, (0, 0))
+        indicator_templates[note_color] = indicator_surface.convert_alpha()
+
+    indicator_surfaces = {}
+    def get_indicator_surface(color, alpha):
+        """Get the indicator tile for a note color at the given alpha"""
+        key = (color, alpha)
+        if key not in indicator_surfaces:
+            indicator_surface = indicator_templates[color].copy()
+            indicator_surface.set_alpha(alpha)
+            indicator_surfaces[key] = indicator_surface
+        return indicator_surfaces[key]
     
     # Pre-cache gradient surfaces for edge flashes
     gradient_cache = {}
@@ -2226,6 +2523,22 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                 pygame.draw.line(gradient_surface, (*color, alpha), (i, 0), (i, height))
             gradient_cache[key] = gradient_surface.convert_alpha()
         return gradient_cache[key]
+
+    # Vertical edge-flash gradients, built once per note color and alpha step (16 steps) so
+    # the flash loop blits a cached surface instead of drawing 175 rows per flash per frame
+    EDGE_FLASH_ALPHA_STEPS = 16
+    edge_flash_gradients = {}
+    def get_edge_flash_gradient(color, alpha_step, width, length=175, max_alpha=85):
+        """Get or create a cached vertical gradient (transparent at the top, max_alpha at the bottom)"""
+        key = (color, alpha_step, width)
+        if key not in edge_flash_gradients:
+            peak_alpha = max_alpha * alpha_step / EDGE_FLASH_ALPHA_STEPS
+            # Build one column and stretch it across the width
+            column = pygame.Surface((1, length), pygame.SRCALPHA)
+            for i in range(length):
+                column.set_at((0, i), (*color, int(peak_alpha * (i / length))))
+            edge_flash_gradients[key] = pygame.transform.scale(column, (width, length)).convert_alpha()
+        return edge_flash_gradients[key]
     
     # Pre-render common text surfaces
     text_cache = {}
@@ -2248,6 +2561,121 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     font_metadata = pygame.font.SysFont(['meiryo', 'msgothic', 'yugothic', 'segoeui', 'arial'], 20)
     font_combo = pygame.font.SysFont(['meiryo', 'msgothic', 'yugothic', 'segoeui', 'arial'], 48)
 
+    # Judgment texts are a fixed set, so render each one once up front
+    judgment_surfaces = {
+        name: font_judgment.render(name, True, WHITE).convert_alpha()
+        for name in ('fantastic', 'perfect', 'great', 'cool', 'bad', 'miss')
+    }
+    # Background (gameplay bg image or white) with the HUD text that only changes with the
+    # scroll direction or autoplay toggle: beatmap metadata, AUTOPLAY tag and stats labels
+    static_background = {'key': None, 'surface': None}
+    def get_static_background(scroll_direction, autoplay_enabled):
+        """Get the composited static background, rebuilding it when its layout changes"""
+        key = (scroll_direction, autoplay_enabled)
+        if static_background['key'] == key:
+            return static_background['surface']
+
+        if gameplay_bg_image:
+            background = gameplay_bg_image.copy()
+        else:
+            background = pygame.Surface((screen_width, screen_height)).convert()
+            background.fill(WHITE)
+        text_blits = []
+
+        # Metadata + image
+        if scroll_direction == 'down':
+            stats_start_y = 20  # Top when tiles spawn from top
+        else:  # 'up'
+            stats_start_y = screen_height - 20  # Bottom when tiles spawn from bottom
+        right_margin = 20
+
+        if 'meta' in level_data and any(k in level_data['meta'] for k in ['title', 'artist', 'creator', 'version']):
+            meta = level_data['meta']
+            title = meta.get('title', 'Unknown')
+            artist = meta.get('artist', 'Unknown')
+            creator = meta.get('creator', 'Unknown')
+            version = meta.get('version', 'Unknown')
+            
+            # Determine difficulty color based on version name (matching level selector colors)
+            version_lower = version.lower()
+            if 'easy' in version_lower or 'beginner' in version_lower:
+                diff_color = (100, 200, 255)  # Light blue
+            elif 'medium' in version_lower or 'platter' in version_lower:
+                diff_color = (150, 220, 150)  # Medium light green
+            elif 'normal' in version_lower or 'basic' in version_lower:
+                diff_color = (100, 255, 100)  # Green
+            elif 'hard' in version_lower or 'advanced' in version_lower:
+                diff_color = (255, 200, 100)  # Orange
+            elif 'expert' in version_lower or 'insane' in version_lower:
+                diff_color = (255, 100, 100)  # Red
+            elif 'extra' in version_lower or 'challenge' in version_lower or 'master' in version_lower:
+                diff_color = (200, 100, 255)  # Purple
+            else:
+                diff_color = (200, 200, 200)  # Gray (default)
+
+            metadata_lines = [
+                (f"{title} - {artist}", (255, 255, 255)),
+                (f"[{version}] by {creator}", diff_color)
+            ]
+
+            for i, (line, color) in enumerate(metadata_lines):
+                meta_text = get_cached_text(font_metadata, line, color)
+                if scroll_direction == 'down':
+                    meta_rect = meta_text.get_rect(right=screen_width - right_margin, top=stats_start_y + i * 25)
+                else:  # 'up'
+                    meta_rect = meta_text.get_rect(right=screen_width - right_margin, bottom=stats_start_y - i * 25)
+                text_blits.append((meta_text, meta_rect))
+            
+            if scroll_direction == 'down':
+                stats_start_y += len(metadata_lines) * 25 + 5
+            else:  # 'up'
+                stats_start_y -= len(metadata_lines) * 25 + 5
+        
+        # Autoplay indicator below title/charter
+        if autoplay_enabled:
+            autoplay_text = get_cached_text(font_metadata, "AUTOPLAY", (255, 100, 100))
+            if scroll_direction == 'down':
+                autoplay_rect = autoplay_text.get_rect(right=screen_width - right_margin, top=stats_start_y)
+            else:  # 'up'
+                autoplay_rect = autoplay_text.get_rect(right=screen_width - right_margin, bottom=stats_start_y)
+            text_blits.append((autoplay_text, autoplay_rect))
+
+        # Stats labels (the numbers next to them are drawn per frame)
+        left_margin = 20
+        if scroll_direction == 'down':
+            stats_bottom_y = screen_height - 20  # Bottom left when tiles spawn from top
+        else:  # 'up'
+            stats_bottom_y = 20  # Top left when tiles spawn from bottom
+
+        for i, label in enumerate(("Progress", "Accuracy", "Score")):
+            if scroll_direction == 'down':
+                y_pos = stats_bottom_y - (i + 1) * 40
+            else:  # 'up'
+                y_pos = stats_bottom_y + i * 40
+            label_text = get_cached_text(font_stats, label, WHITE)
+            label_rect = label_text.get_rect(left=left_margin, top=y_pos)
+            text_blits.append((label_text, label_rect))
+
+        background.blits(text_blits, doreturn=0)
+        static_background['key'] = key
+        static_background['surface'] = background
+        return background
+
+    # Countdown digits, rendered once ("3", "2", "1")
+    countdown_surfaces = [font_countdown.render(digit, True, (255, 255, 255)).convert_alpha() for digit in ("3", "2", "1")]
+
+    # Full-screen solid overlays, built once; only their surface alpha changes per frame
+    fade_overlay = pygame.Surface((screen_width, screen_height)).convert()
+    fade_overlay.fill((0, 0, 0))
+    flash_overlay = pygame.Surface((screen_width, screen_height)).convert()
+    flash_overlay.fill((255, 255, 255))
+
+    # Last rendered combo value and its surface (re-rendered when the combo changes)
+    combo_surface_value = None
+    combo_base_surface = None
+    # Last rendered stats number per label: label -> (text, surface)
+    stats_number_surfaces = {}
+
     count_fantastic = 0
     count_perfect = 0
     count_great = 0
@@ -2260,7 +2688,7 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     current_health = 25.0
     target_health = 25.0  # Animated health bar target
     displayed_health = 25.0  # Current animated health
-    lost_health_bars = []  # [(width, alpha, timestamp)] - white bars showing health loss
+    lost_health_bars = deque()  # [(width, alpha, timestamp)] - white bars showing health loss, oldest first
     # Single judgment display state: {text, x, y, last_update_time, is_visible, just_appeared}
     current_judgment = {'text': '', 'x': 0, 'y': 0, 'last_update_time': 0, 'is_visible': False, 'just_appeared': False}
 
@@ -2268,9 +2696,10 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     combo_pop_time = 0
     combo_animation_duration = 0.08
 
-    # Track events that have already shown "tile reached box" shake
-    reached_shake_events = set()
-    resolved_events = set()
+    # Track events that have already shown "tile reached box" shake, and events already
+    # hit or missed - one flag byte per event index rather than a set of ints
+    reached_shake_events = bytearray(len(level))
+    resolved_events = bytearray(len(level))
 
     paused = False
     pause_start_time = 0
@@ -2321,6 +2750,15 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     
     # Track which keys are currently pressed
     keys_pressed = set()
+    # Boxes covered by the held keys; rebuilt only when a mapped key goes down or up
+    held_boxes = set()
+
+    def rebuild_held_boxes():
+        held_boxes.clear()
+        for key in keys_pressed:
+            # A key can map to multiple (color, box) pairs
+            for color, box_idx in KEY_MAPPINGS.get(key, ()):
+                held_boxes.add(box_idx)
 
     # New 5-tier judgment system with symmetric timing windows
     # Timing windows (in seconds from perfect time):
@@ -2342,6 +2780,19 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     # Maximum timing window (for miss detection)
     MAX_TIMING_WINDOW = 0.180
 
+    # Hit effects per judgment: (particle color, particle count, glow intensity)
+    HIT_EFFECTS = {
+        'fantastic': ((0, 255, 255), 15, 1.0),    # Bright cyan
+        'perfect': ((255, 215, 0), 12, 0.8),      # Gold
+        'great': ((255, 255, 255), 10, 0.6),      # White
+        'cool': ((180, 220, 255), 7, 0.4),        # Light blue
+        'bad': ((150, 150, 150), 5, 0.3),         # Gray
+    }
+
+    # Particle burst directions: 64 unit vectors around the circle, picked with 6 random bits
+    # instead of a uniform angle plus cos/sin for every particle
+    PARTICLE_DIRECTIONS = tuple((math.cos(i * 2 * math.pi / 64), math.sin(i * 2 * math.pi / 64)) for i in range(64))
+
     def judgment_from_timing(elapsed_time, note_time):
         """Get judgment based on timing difference (can be early or late)"""
         timing_diff = abs(elapsed_time - note_time)
@@ -2354,7 +2805,12 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
         # Outside all windows = miss
         return None, None, None
 
+    # Box centers only depend on the scroll direction, so compute them once per direction
+    box_centers_cache = {}
+
     def box_centers_display():
+        if scroll_direction in box_centers_cache:
+            return box_centers_cache[scroll_direction]
         # Horizontal layout: 4 boxes
         # Box 0, Box 1, Box 2, Box 3 (left to right)
         if scroll_direction == 'down':
@@ -2364,12 +2820,39 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
             # Tiles spawn from bottom, boxes at top
             box_offset = -(screen_height // 2 - 80)  # Position near top (mirrored)
         
-        return [
+        box_centers_cache[scroll_direction] = (
             (center_x - spacing * 1.5, center_y + box_offset),  # 0: leftmost
             (center_x - spacing * 0.5, center_y + box_offset),  # 1: center-left
             (center_x + spacing * 0.5, center_y + box_offset),  # 2: center-right
             (center_x + spacing * 1.5, center_y + box_offset),  # 3: rightmost
-        ]
+        )
+        return box_centers_cache[scroll_direction]
+
+    # Top-left corner of each box (for the flash overlays), cached alongside the centers
+    box_positions_cache = {}
+
+    def box_positions_display():
+        if scroll_direction not in box_positions_cache:
+            box_positions_cache[scroll_direction] = tuple(
+                (bx - square_size // 2, by - square_size // 2) for bx, by in box_centers_display()
+            )
+        return box_positions_cache[scroll_direction]
+
+    # Static box row composited once per (scroll direction, box left out for shaking)
+    board_cache = {}
+
+    def get_board_surface(excluded_box=None):
+        key = (scroll_direction, excluded_box)
+        if key not in board_cache:
+            box_positions = [(int(bx - square_size // 2), int(by - square_size // 2)) for bx, by in box_centers_display()]
+            board_x, board_y = box_positions[0]
+            board_width = box_positions[3][0] - board_x + square_size
+            board_surface = pygame.Surface((board_width, square_size), pygame.SRCALPHA).convert_alpha()
+            for box_idx, (bx, by) in enumerate(box_positions):
+                if box_idx != excluded_box:
+                    board_surface.blit(box_image_rounded, (bx - board_x, by - board_y))
+            board_cache[key] = (board_surface, (board_x, board_y))
+        return board_cache[key]
 
     def add_judgment_text(text, box_idx):
         nonlocal current_judgment
@@ -2381,17 +2864,38 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
             'text': text,
             'x': cx,
             'y': cy,
-            'last_update_time': time.time(),
+            'last_update_time': now,
             'is_visible': True,
             'just_appeared': not was_visible
         }
 
     def trigger_box_shake(box_idx, intensity=9):
         nonlocal shake_time, shake_intensity, shake_box
-        shake_time = time.time()
+        shake_time = now
         shake_intensity = intensity
         shake_box = box_idx
 
+    def spawn_hit_effects(box_idx, particle_color, particle_count, glow_intensity):
+        """Spawn the particle burst, glow and impact wave for a hit on box_idx"""
+        hit_x, hit_y = box_centers_display()[box_idx]
+        current_time = now
+        
+        # Create particle burst
+        getrandbits = random.getrandbits
+        rand = random.random
+        for _ in range(particle_count):
+            dir_x, dir_y = PARTICLE_DIRECTIONS[getrandbits(6)]
+            speed = 100 + 200 * rand()
+            size = 3 + 4 * rand()
+            particles.append((hit_x, hit_y, dir_x * speed, dir_y * speed, particle_color, size, current_time))
+        
+        # Add hit glow effect
+        hit_glows.append((box_idx, current_time, glow_intensity))
+        
+        # Add impact wave
+        impact_waves.append((hit_x, hit_y, current_time, particle_color))
+        return current_time
+
     def resolve_miss(evt_idx, miss_box_idx):
         nonlocal count_miss, total_notes, combo, current_event_index, current_health, lost_health_bars
         nonlocal fading_tiles, approach_indicators
@@ -2407,10 +2911,10 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
         if old_health > current_health:
             health_bar_width = int(screen_width * 0.3)
             old_width = int(health_bar_width * (old_health / max_health))
-            lost_health_bars.append((old_width, 255, time.time()))
+            lost_health_bars.append((old_width, 255, now))
         add_judgment_text("miss", miss_box_idx)
         
-        resolved_events.add(evt_idx)
+        resolved_events[evt_idx] = 1
         current_event_index += 1
 
     def resolve_hit(evt_idx, hit_box_idx, judgment_name, judgment_score, health_change):
@@ -2428,7 +2932,7 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
         if old_health > current_health:
             health_bar_width = int(screen_width * 0.3)
             old_width = int(health_bar_width * (old_health / max_health))
-            lost_health_bars.append((old_width, 255, time.time()))
+            lost_health_bars.append((old_width, 255, now))
 
         score += judgment_score
         total_hits += 1
@@ -2438,7 +2942,7 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
             combo = 0
         else:
             combo += 1
-            combo_pop_time = time.time()
+            combo_pop_time = now
 
         # Update judgment counts
         if judgment_name == 'fantastic':
@@ -2456,58 +2960,12 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
         if not game_over:
             trigger_box_shake(hit_box_idx, intensity=9)
         if game_settings.get('hitsounds_enabled', True):
-            hitsounds['normal'].play()
+            play_hitsound()
 
         # ===== ADD FLASHY EFFECTS =====
-        # Get box center for effects
-        box_centers = box_centers_display()
-        hit_x, hit_y = box_centers[hit_box_idx]
-        current_time = time.time()
-        
-        # Determine effect color based on judgment
-        if judgment_name == 'fantastic':
-            # Fantastic - bright cyan particles
-            particle_color = (0, 255, 255)  # Cyan
-            particle_count = 15  # Reduced from 30
-            glow_intensity = 1.0  # Reduced from 2.0
-        elif judgment_name == 'perfect':
-            # Perfect - gold particles
-            particle_color = (255, 215, 0)  # Gold
-            particle_count = 12  # Reduced from 25
-            glow_intensity = 0.8  # Reduced from 1.5
-        elif judgment_name == 'great':
-            # Great - white particles
-            particle_color = (255, 255, 255)  # White
-            particle_count = 10  # Reduced from 20
-            glow_intensity = 0.6  # Reduced from 1.2
-        elif judgment_name == 'cool':
-            # Cool - light blue particles
-            particle_color = (180, 220, 255)
-            particle_count = 7  # Reduced from 15
-            glow_intensity = 0.4  # Reduced from 0.8
-        else:  # bad
-            # Bad - gray particles
-            particle_color = (150, 150, 150)
-            particle_count = 5  # Reduced from 10
-            glow_intensity = 0.3  # Reduced from 0.5
-        
-        # Create particle burst
-        import random
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(100, 300)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            size = random.uniform(3, 7)
-            particles.append((hit_x, hit_y, vx, vy, particle_color, size, current_time))
-        
-        # Add hit glow effect
-        hit_glows.append((hit_box_idx, current_time, glow_intensity))
-        
-        # Add impact wave
-        impact_waves.append((hit_x, hit_y, current_time, particle_color))
+        spawn_hit_effects(hit_box_idx, *HIT_EFFECTS[judgment_name])
 
-        resolved_events.add(evt_idx)
+        resolved_events[evt_idx] = 1
         current_event_index += 1
 
     def handle_click(button_name, elapsed_time_local, evt_idx):
@@ -2540,12 +2998,40 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
     POST_LEVEL_DELAY = 3.0
     POST_LEVEL_MUSIC_FADE = 3.0
     
+    # Next note whose autoplay hitsound hasn't been played yet
+    autoplay_sound_index = 0
+    # Next note that hasn't been spawned as an approach indicator yet
+    next_spawn_index = 0
+
+    # Music starts from a one-shot timer event instead of a per-frame elapsed-time check.
+    # The timer is cancelled while paused and re-armed with whatever countdown remains.
+    MUSIC_START_EVENT = pygame.USEREVENT + 1
+
+    def arm_music_timer():
+        remaining = music_offset_adjustment - (time.monotonic() - game_start_time - total_pause_duration)
+        pygame.time.set_timer(MUSIC_START_EVENT, max(1, int(remaining * 1000)), loops=1)
+
+    arm_music_timer()
+
     # Game over on HP = 0
     game_over = False
     game_over_time = None
 
+    # Frame-invariant layout, computed once instead of per frame or per tile
+    half_square = square_size // 2
+    half_indicator = indicator_size // 2
+    edge_flash_height = square_size // 2 + spacing - 10
+    half_edge_flash = edge_flash_height // 2
+    edge_flash_duration = 0.25
+    edge_offset = 0
+    health_bar_width = int(screen_width * 0.3)  # 30% width, centered
+    health_bar_x = (screen_width - health_bar_width) // 2
+    health_bar_thickness = 12  # Decreased from 20
+
     while running:
-        elapsed_time = time.time() - game_start_time - total_pause_duration
+        # One clock read per frame, refreshed after event handling (which can block in the pause menu)
+        now = time.monotonic()
+        elapsed_time = now - game_start_time - total_pause_duration
 
         if game_settings.get('fade_effects', True):
             if elapsed_time < fade_in_delay:
@@ -2560,64 +3046,37 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
 
         display_time = paused_elapsed_time if paused else elapsed_time
 
-        if music_start_time is None and elapsed_time >= music_offset_adjustment and not paused:
-            # For SM charts with negative times, seek to the calculated position
-            if audio_start_position > 0:
-                pygame.mixer.music.play(start=audio_start_position)
-            else:
-                pygame.mixer.music.play()
-            music_start_time = time.time()
-
-        if current_event_index < len(level):
-            target_time, target_box, target_color, target_hitsound = level[current_event_index]
-        
-        # Autoplay
-        if autoplay_enabled and not paused and current_event_index < len(level):
-            if elapsed_time >= target_time:
+        # Autoplay - resolve every event that became due since the last frame
+        if autoplay_enabled and not paused and current_event_index < level_count:
+            # Hitsounds run on their own cursor, fired on the frame nearest each note (up to half
+            # a frame early) instead of on the first frame after it, which is up to a frame late
+            autoplay_sound_index = max(autoplay_sound_index, current_event_index)
+            sound_due_idx = bisect.bisect_right(ev_times, elapsed_time + clock.get_time() / 2000)
+            if game_settings.get('hitsounds_enabled', True):
+                for _ in range(autoplay_sound_index, sound_due_idx):
+                    play_hitsound()
+            autoplay_sound_index = max(autoplay_sound_index, sound_due_idx)
+
+            due_idx = bisect.bisect_right(ev_times, elapsed_time)
+            while current_event_index < due_idx:
+                target_box = ev_boxes[current_event_index]
                 score += 500  # Fantastic score
                 total_hits += 1
                 total_notes += 1
                 combo += 1
-                combo_pop_time = time.time()
+                combo_pop_time = now
                 count_fantastic += 1
                 # Autoplay always gets perfect timing, so health +0.5
                 current_health = min(max_health, current_health + 0.5)
 
                 add_judgment_text("fantastic", target_box)
-                resolved_events.add(current_event_index)
+                resolved_events[current_event_index] = 1
                 if not game_over:
                     trigger_box_shake(target_box, intensity=9)
 
-                # Play hitsounds during autoplay
-                if game_settings.get('hitsounds_enabled', True):
-                    hitsounds['normal'].play()
-                
                 # ===== ADD FANCY EFFECTS TO AUTOPLAY =====
-                # Get box center for effects
-                box_centers = box_centers_display()
-                hit_x, hit_y = box_centers[target_box]
-                current_time = time.time()
-                
                 # Perfect autoplay always gets gold effects
-                particle_color = (255, 215, 0)  # Gold
-                particle_count = 25
-                glow_intensity = 1.5
-                
-                # Create particle burst
-                import random
-                for _ in range(particle_count):
-                    angle = random.uniform(0, 2 * math.pi)
-                    speed = random.uniform(100, 300)
-                    vx = math.cos(angle) * speed
-                    vy = math.sin(angle) * speed
-                    size = random.uniform(3, 7)
-                    particles.append((hit_x, hit_y, vx, vy, particle_color, size, current_time))
-                
-                # Add hit glow effect
-                hit_glows.append((target_box, current_time, glow_intensity))
-                
-                # Add impact wave
-                impact_waves.append((hit_x, hit_y, current_time, particle_color))
+                current_time = spawn_hit_effects(target_box, (255, 215, 0), 25, 1.5)
                 
                 # Trigger dot animation for autoplay
                 if target_box not in last_active_dots:
@@ -2631,6 +3090,14 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
             if event.type == pygame.QUIT:
                 running = False
 
+            if event.type == MUSIC_START_EVENT and music_start_time is None:
+                # For SM charts with negative times, seek to the calculated position
+                if audio_start_position > 0:
+                    pygame.mixer.music.play(start=audio_start_position)
+                else:
+                    pygame.mixer.music.play()
+                music_start_time = time.monotonic()
+
             if event.type == pygame.KEYDOWN:
                 # Check for Ctrl+P to toggle autoplay (debug feature)
                 keys_held = pygame.key.get_pressed()
@@ -2642,9 +3109,11 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                 if event.key == pygame.K_ESCAPE:
                     # Pause and show settings menu
                     paused = True
-                    pause_start_time = time.time()
+                    pause_start_time = time.monotonic()
                     paused_elapsed_time = elapsed_time
                     pygame.mixer.music.pause()
+                    if music_start_time is None:
+                        pygame.time.set_timer(MUSIC_START_EVENT, 0)
                     
                     # Show settings menu
                     settings_result = show_settings_menu(from_game=True)
@@ -2652,8 +3121,10 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                     if settings_result == 'BACK':
                         # Resume game
                         paused = False
-                        total_pause_duration += time.time() - pause_start_time
+                        total_pause_duration += time.monotonic() - pause_start_time
                         pygame.mixer.music.unpause()
+                        if music_start_time is None:
+                            arm_music_timer()
                         # Update volumes in case they changed
                         pygame.mixer.music.set_volume(game_settings.get('music_volume', 0.7))
                         for sound in hitsounds.values():
@@ -2686,31 +3157,36 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                 if not paused and display_time >= 3.0 and not game_over:
                     if event.key in KEY_MAPPINGS:
                         keys_pressed.add(event.key)
+                        rebuild_held_boxes()
                         
                         # A key can map to multiple (color, box) pairs - check all of them
-                        elapsed_time = time.time() - game_start_time - total_pause_duration
+                        press_time = time.monotonic()
+                        elapsed_time = press_time - game_start_time - total_pause_duration
+                        # Notes after this index are too early for any timing window
+                        window_end_idx = bisect.bisect_right(ev_times, elapsed_time + MAX_TIMING_WINDOW)
                         for color, box_idx in KEY_MAPPINGS[event.key]:
                             # Check all unhit notes within timing window for this color and box
-                            for check_idx in range(current_event_index, len(level)):
-                                if check_idx not in resolved_events:
-                                    evt_time, evt_box, evt_color, evt_hitsound = level[check_idx]
+                            for check_idx in range(current_event_index, window_end_idx):
+                                if not resolved_events[check_idx]:
                                     # Only check notes that match the pressed key's color and box
-                                    if evt_color == color and evt_box == box_idx:
+                                    if ev_colors[check_idx] == color and ev_boxes[check_idx] == box_idx:
                                         if handle_click(color, elapsed_time, check_idx):
                                             # Add input flash (only if not game over)
                                             if not game_over:
-                                                input_flashes[box_idx] = (time.time(), color)
+                                                input_flashes[box_idx] = (press_time, color)
                                             break
             
             if event.type == pygame.KEYUP:
                 # Remove key from pressed set
                 if event.key in KEY_MAPPINGS:
                     keys_pressed.discard(event.key)
+                    rebuild_held_boxes()
+
+        now = time.monotonic()
+        elapsed_time = now - game_start_time - total_pause_duration
 
         # Auto-miss past window
         if not paused and not game_over:
-            elapsed_time = time.time() - game_start_time - total_pause_duration
-            
             # Check for game over (HP = 0 or below)
             if current_health <= 0.01 and not game_over:  # Use 0.01 to handle floating point precision
                 game_over = True
@@ -2744,68 +3220,47 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                 # Clear approach_indicators since all tiles are now fading
                 approach_indicators = []
             
-            while current_event_index < len(level) and elapsed_time > level[current_event_index][0] + MAX_TIMING_WINDOW:
-                missed_time, missed_box, missed_color, missed_hitsound = level[current_event_index]
-                if current_event_index not in resolved_events:
-                    resolve_miss(current_event_index, missed_box)
+            # Every event before this index is past its timing window
+            miss_idx = bisect.bisect_left(ev_times, elapsed_time - MAX_TIMING_WINDOW)
+            while current_event_index < miss_idx:
+                if not resolved_events[current_event_index]:
+                    resolve_miss(current_event_index, ev_boxes[current_event_index])
                 else:
                     current_event_index += 1
 
-            if current_event_index < len(level):
-                target_time, target_box, target_color, target_hitsound = level[current_event_index]
-
             # Maintain approach indicators - remove tiles that have been resolved or passed timing window
             approach_indicators = [
                 (box_idx, color, t_time, duration, evt_idx, side)
                 for box_idx, color, t_time, duration, evt_idx, side in approach_indicators
-                if evt_idx not in resolved_events and elapsed_time <= t_time + MAX_TIMING_WINDOW
+                if not resolved_events[evt_idx] and elapsed_time <= t_time + MAX_TIMING_WINDOW
             ]
 
-            existing_events = {evt_idx for _, _, _, _, evt_idx, _ in approach_indicators}
-            JUDGE_DELAY_AFTER_SPAWN = 0.1
-
             # Use the pre-calculated constant approach duration for all tiles
             approach_duration = APPROACH_DURATION
-            
-            # Dynamic lookahead based on approach duration to show all visible notes
-            # lookahead time = approach_duration + small buffer
-            lookahead_time = approach_duration + 0.2
-            lookahead = 0
-            for i in range(current_event_index, len(level)):
-                if level[i][0] <= elapsed_time + lookahead_time:
-                    lookahead += 1
-                else:
-                    break
-            
-            # Cap lookahead for performance
-            lookahead = min(lookahead, 50)
-            
-            lookback = 5
-            start_scan = max(0, current_event_index - lookback)
-            
+
+            # Spawn cursor: each note is considered exactly once, when it enters the approach window
             # Only spawn new tiles if not game over
             if not game_over:
-                for i in range(start_scan, min(current_event_index + lookahead, len(level))):
-                    if i not in existing_events:
-                        evt_time, evt_box, evt_color, evt_hitsound = level[i]
-                        # Only spawn if within approach window
-                        if elapsed_time <= evt_time <= elapsed_time + approach_duration:
-                            # All tiles from top
-                            approach_indicators.append((evt_box, evt_color, evt_time, approach_duration, i, 'top'))
+                while next_spawn_index < level_count and ev_times[next_spawn_index] <= elapsed_time + approach_duration:
+                    evt_time, evt_box, evt_color, evt_hitsound = level[next_spawn_index]
+                    # Notes already resolved or already past (e.g. after a stall) never get a tile
+                    if evt_time >= elapsed_time and not resolved_events[next_spawn_index]:
+                        # All tiles from top
+                        approach_indicators.append((evt_box, evt_color, evt_time, approach_duration, next_spawn_index, 'top'))
+                    next_spawn_index += 1
 
             # One-time shake exactly when tile reaches box (TRULY timing-driven; independent of input)
             # Don't shake boxes during game over
             if not game_over:
-                while arrival_shake_index < len(level) and elapsed_time >= level[arrival_shake_index][0]:
-                    t_note, box_idx, color, hs = level[arrival_shake_index]
-                    if arrival_shake_index not in reached_shake_events:
-                        reached_shake_events.add(arrival_shake_index)
-                        trigger_box_shake(box_idx, intensity=9)
+                shake_due_index = bisect.bisect_right(ev_times, elapsed_time)
+                while arrival_shake_index < shake_due_index:
+                    if not reached_shake_events[arrival_shake_index]:
+                        reached_shake_events[arrival_shake_index] = 1
+                        trigger_box_shake(ev_boxes[arrival_shake_index], intensity=9)
                     arrival_shake_index += 1
         
         # ===== Game over handling (HP = 0) - outside paused/game_over check so it can execute =====
         if game_over and game_over_time is not None:
-            elapsed_time = time.time() - game_start_time - total_pause_duration
             # After 2.5 seconds, return to level selector
             if (elapsed_time - game_over_time) >= 2.5:
                 print("Returning to level selector after game over")
@@ -2815,13 +3270,11 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
         
         # ===== End-of-level flow (NO freezing; let visuals keep running) =====
         # Mark end-of-level once ALL notes are resolved (hit or miss)
-        if current_event_index >= len(level) and level_end_elapsed is None and not game_over:
-            elapsed_time = time.time() - game_start_time - total_pause_duration
+        if current_event_index >= level_count and level_end_elapsed is None and not game_over:
             level_end_elapsed = elapsed_time
 
         # After 2s delay, fade music for 3s, then fade screen and return to selector
         if level_end_elapsed is not None and not game_over:
-            elapsed_time = time.time() - game_start_time - total_pause_duration
             if (elapsed_time - level_end_elapsed) >= POST_LEVEL_DELAY and not music_fade_started:
                 pygame.mixer.music.fadeout(int(POST_LEVEL_MUSIC_FADE * 1000))
                 music_fade_started = True
@@ -2832,80 +3285,55 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                     fade_out(screen, duration=0.7)
                 return 'RESTART'
 
-        # Draw background (either gameplay bg image or white)
-        if gameplay_bg_image:
-            screen.blit(gameplay_bg_image, (0, 0))
-        else:
-            screen.fill(WHITE)
+        # Draw background (either gameplay bg image or white) with the static HUD text on it
+        screen.blit(get_static_background(scroll_direction, autoplay_enabled), (0, 0))
 
         # Screen shake offset
         shake_x, shake_y = 0, 0
         if shake_time > 0:
-            time_since_shake = time.time() - shake_time
+            time_since_shake = now - shake_time
             if time_since_shake < 0.15:
                 decay = 1 - (time_since_shake / 0.15)
-                import random
-                shake_x = random.randint(-int(shake_intensity * decay), int(shake_intensity * decay))
-                shake_y = random.randint(-int(shake_intensity * decay), int(shake_intensity * decay))
+                shake_range = int(shake_intensity * decay)
+                shake_x = randint(-shake_range, shake_range)
+                shake_y = randint(-shake_range, shake_range)
             else:
                 shake_time = 0
                 shake_intensity = 0
                 shake_box = None
 
         # Draw 4 boxes in horizontal layout - position based on scroll direction
+        # Boxes and their flash overlays are collected and drawn with one blits() call
+        frame_blits = []
         box_centers = box_centers_display()
         
-        # Box 0: leftmost
-        shake_0_x = shake_x if shake_box == 0 else 0
-        shake_0_y = shake_y if shake_box == 0 else 0
-        box_0_x, box_0_y = box_centers[0]
-        screen.blit(box_image_rounded, (box_0_x - square_size // 2 + shake_0_x, box_0_y - square_size // 2 + shake_0_y))
-
-        # Box 1: center-left
-        shake_1_x = shake_x if shake_box == 1 else 0
-        shake_1_y = shake_y if shake_box == 1 else 0
-        box_1_x, box_1_y = box_centers[1]
-        screen.blit(box_image_rounded, (box_1_x - square_size // 2 + shake_1_x, box_1_y - square_size // 2 + shake_1_y))
-
-        # Box 2: center-right
-        shake_2_x = shake_x if shake_box == 2 else 0
-        shake_2_y = shake_y if shake_box == 2 else 0
-        box_2_x, box_2_y = box_centers[2]
-        screen.blit(box_image_rounded, (box_2_x - square_size // 2 + shake_2_x, box_2_y - square_size // 2 + shake_2_y))
-
-        # Box 3: rightmost
-        shake_3_x = shake_x if shake_box == 3 else 0
-        shake_3_y = shake_y if shake_box == 3 else 0
-        box_3_x, box_3_y = box_centers[3]
-        screen.blit(box_image_rounded, (box_3_x - square_size // 2 + shake_3_x, box_3_y - square_size // 2 + shake_3_y))
+        # Static boxes come from the pre-composited board; a shaken box is drawn on its own
+        frame_blits.append(get_board_surface(shake_box))
+        if shake_box is not None:
+            shaken_x, shaken_y = box_centers[shake_box]
+            frame_blits.append((box_image_rounded, (shaken_x - half_square + shake_x, shaken_y - half_square + shake_y)))
 
         # Use frozen time for rendering when paused
         render_time = display_time
 
         # Big box positions for overlays (no shake here; shake is already on base image)
-        big_box_positions = [
-            (box_0_x - square_size // 2, box_0_y - square_size // 2),  # 0: leftmost
-            (box_1_x - square_size // 2, box_1_y - square_size // 2),  # 1: center-left
-            (box_2_x - square_size // 2, box_2_y - square_size // 2),  # 2: center-right
-            (box_3_x - square_size // 2, box_3_y - square_size // 2),  # 3: rightmost
-        ]
+        big_box_positions = box_positions_display()
 
         # ===== Arrival flash overlay (timing-driven; works even if you miss) =====
         # Only render arrival flashes if not game over
         if not game_over:
             # Move pointer forward past old flashes
-            while arrival_flash_index < len(level) and render_time > level[arrival_flash_index][0] + arrival_flash_duration:
-                arrival_flash_index += 1
+            arrival_flash_index = max(arrival_flash_index, bisect.bisect_left(ev_times, render_time - arrival_flash_duration))
 
             # For each box, keep the strongest flash currently active
             best_flash_alpha = [0, 0, 0, 0]
             best_flash_color = [None, None, None, None]
 
-            j = arrival_flash_index
             # Scan forward only a small window around "now"
-            while j < len(level) and level[j][0] <= render_time + arrival_flash_duration:
-                t_note, box_idx, color, hs = level[j]
-                dt = render_time - t_note
+            flash_window_end = bisect.bisect_right(ev_times, render_time + arrival_flash_duration)
+            for j in range(arrival_flash_index, flash_window_end):
+                box_idx = ev_boxes[j]
+                dt = render_time - ev_times[j]
                 if 0 <= dt <= arrival_flash_duration:
                     if dt <= arrival_flash_sustain:
                         alpha = 255
@@ -2916,15 +3344,14 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
 
                     if alpha > best_flash_alpha[box_idx]:
                         best_flash_alpha[box_idx] = alpha
-                        best_flash_color[box_idx] = color
-                j += 1
+                        best_flash_color[box_idx] = ev_colors[j]
 
             # Draw the flashes (move WITH the box shake so it doesn't look like the tile shakes)
             for box_idx in range(4):
                 alpha = best_flash_alpha[box_idx]
                 color = best_flash_color[box_idx]
                 if alpha > 0 and color is not None:
-                    overlay_img = box_red_rounded if color == 'red' else box_blue_rounded
+                    overlay_img = box_overlays[color]
                     overlay_surface = overlay_img.copy()
                     overlay_surface.set_alpha(alpha)
 
@@ -2935,11 +3362,11 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                         bx += shake_x
                         by += shake_y
 
-                    screen.blit(overlay_surface, (bx, by))
+                    frame_blits.append((overlay_surface, (bx, by)))
 
         # ===== Input flash overlay (shows taps even when nothing is hit) =====
         input_flash_duration = 0.25
-        current_time = time.time()
+        current_time = now
         
         # Clean up old input flashes and render active ones
         expired_boxes = []
@@ -2957,7 +3384,7 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                     alpha = max(0, int(255 * (1 - fade_t)))
                 
                 if alpha > 0:
-                    overlay_img = box_red_rounded if flash_color == 'red' else box_blue_rounded
+                    overlay_img = box_overlays[flash_color]
                     overlay_surface = overlay_img.copy()
                     overlay_surface.set_alpha(alpha)
                     
@@ -2968,25 +3395,39 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                         bx += shake_x
                         by += shake_y
                     
-                    screen.blit(overlay_surface, (bx, by))
+                    frame_blits.append((overlay_surface, (bx, by)))
         
         # Remove expired flashes
         for box_idx in expired_boxes:
             del input_flashes[box_idx]
 
+        screen.blits(frame_blits, doreturn=0)
 
-        # Edge flash indicators
-        edge_flash_height = square_size // 2 + spacing - 10
-        edge_flash_duration = 0.25
-        edge_offset = 0
-
-        # Only render edge flashes if not game over
-        if not game_over:
-            for box_idx, color, target_time, approach_duration, event_idx, side in approach_indicators:
-                approach_start_time = target_time - approach_duration
-                time_until_start = approach_start_time - render_time
 
-                if 0 <= time_until_start <= edge_flash_duration:
+        # Approach indicators
+        # Tile spawn position based on scroll direction
+        if scroll_direction == 'down':
+            start_y = 0  # Spawn from top of screen
+        else:  # 'up'
+            start_y = screen_height  # Spawn from bottom of screen
+
+        # Per-lane blit x and travel distance, so each tile only interpolates its y
+        lane_blit_x = [int(cx - half_indicator) for cx, cy in box_centers]
+        lane_travel_y = [cy - start_y for cx, cy in box_centers]
+
+        # Edge flashes and indicators are collected in one pass over approach_indicators.
+        # Indicators are spawned in note order with one shared approach duration, so walking
+        # the list backwards already renders the farthest tiles first (back-to-front)
+        edge_flashes_enabled = not game_over  # Only render edge flashes if not game over
+        edge_blits = []
+        indicator_blits = []
+        for box_idx, color, target_time, approach_duration, event_idx, side in reversed(approach_indicators):
+            time_until_target = target_time - render_time
+
+            # Edge flash while the tile is still before its approach start
+            if edge_flashes_enabled and time_until_target >= approach_duration:
+                time_until_start = time_until_target - approach_duration
+                if time_until_start <= edge_flash_duration:
                     flash_progress = 1 - (time_until_start / edge_flash_duration)
 
                     if flash_progress < 0.3:
@@ -2994,60 +3435,24 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                     else:
                         alpha = int(255 * (1 - (flash_progress - 0.3) / 0.7))
 
-                    box_centers = box_centers_display()
-
-                    target_x, target_y = box_centers[box_idx]
-
                     # All edge flashes from top
-                    gradient_x = target_x - edge_flash_height // 2
-                    edge_y = edge_offset
-                    is_left = False  # Vertical gradient
+                    gradient_x = box_centers[box_idx][0] - half_edge_flash
 
-                    flash_color = (255, 0, 0) if color == 'red' else (0, 0, 255)
-                    gradient_length = 175
-                    max_gradient_alpha = 85
+                    alpha_step = round(alpha * EDGE_FLASH_ALPHA_STEPS / 255)
+                    if alpha_step > 0:
+                        gradient_surface = get_edge_flash_gradient(edge_flash_colors[color], alpha_step, edge_flash_height)
+                        edge_blits.append((gradient_surface, (int(gradient_x), int(edge_offset))))
 
-                    # For vertical movement, create vertical gradient
-                    gradient_surface = pygame.Surface((edge_flash_height, gradient_length), pygame.SRCALPHA)
-                    for i in range(gradient_length):
-                        gradient_alpha = int(max_gradient_alpha * (i / gradient_length) * (alpha / 255))
-                        gradient_color = (*flash_color, gradient_alpha)
-                        pygame.draw.rect(gradient_surface, gradient_color, (0, i, edge_flash_height, 1))
-
-                    screen.blit(gradient_surface, (int(gradient_x), int(edge_y)))
-
-        # Approach indicators
-        indicator_size = 60  # Original size restored
-        
-        # Sort approach indicators by progress (render back-to-front for proper layering)
-        # Calculate progress for each and sort by it
-        sorted_indicators = []
-        for box_idx, color, target_time, approach_duration, event_idx, side in approach_indicators:
-            approach_start_time = target_time - approach_duration
-            progress = (render_time - approach_start_time) / approach_duration
-            progress = max(0.0, min(1.0, progress))
-            sorted_indicators.append((progress, box_idx, color, target_time, approach_duration, event_idx, side))
-        
-        # Sort by progress (ascending) so tiles farther away render first
-        sorted_indicators.sort(key=lambda x: x[0])
-        
-        for progress, box_idx, color, target_time, approach_duration, event_idx, side in sorted_indicators:
-
-            box_centers = box_centers_display()
-
-            target_x, target_y = box_centers[box_idx]
-            # Tile spawn position based on scroll direction
-            start_x = target_x
-            if scroll_direction == 'down':
-                start_y = 0  # Spawn from top of screen
-            else:  # 'up'
-                start_y = screen_height  # Spawn from bottom of screen
+            progress = 1.0 - time_until_target / approach_duration
+            if progress < 0.0:
+                progress = 0.0
+            elif progress > 1.0:
+                progress = 1.0
 
-            current_x = start_x + (target_x - start_x) * progress
-            current_y = start_y + (target_y - start_y) * progress
+            current_y = start_y + lane_travel_y[box_idx] * progress
 
             # Tiles start fading when they reach target (progress >= 1.0)
-            if progress >= 1.0 and event_idx not in resolved_events:
+            if progress >= 1.0 and not resolved_events[event_idx]:
                 # Tile has reached the box - start fading
                 time_since_arrival = render_time - target_time
                 fade_duration_here = 0.15
@@ -3064,24 +3469,19 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                     alpha = 245
             
             if alpha > 0:
-                indicator_color = (255, 0, 0) if color == 'red' else (0, 0, 255)
-                border_color = (255, 255, 255) if color == 'red' else (255, 215, 0)  # White border for red, yellow for blue
-                indicator_surface = pygame.Surface((indicator_size, indicator_size), pygame.SRCALPHA)
-                # Draw border first
-                pygame.draw.rect(indicator_surface, (*border_color, alpha), (0, 0, indicator_size, indicator_size), 0, 8)
-                # Draw colored fill slightly smaller to create border effect
-                pygame.draw.rect(indicator_surface, (*indicator_color, alpha), (3, 3, indicator_size - 6, indicator_size - 6), 0, 6)
-                screen.blit(indicator_surface, (int(current_x - indicator_size // 2), int(current_y - indicator_size // 2)))
+                indicator_surface = get_indicator_surface(color, alpha)
+                indicator_blits.append((indicator_surface, (lane_blit_x[box_idx], int(current_y - half_indicator))))
+        # Edge flashes go under the tiles, in note order as before
+        edge_blits.reverse()
+        screen.blits(edge_blits, doreturn=0)
+        screen.blits(indicator_blits, doreturn=0)
 
         # Draw health bar (30% width, centered) with animations
         # Rendered AFTER tile indicators so it appears on top
-        health_bar_width = int(screen_width * 0.3)
-        health_bar_x = (screen_width - health_bar_width) // 2
         if scroll_direction == 'down':
             health_bar_y = 50  # At top when tiles spawn from top
         else:  # 'up'
             health_bar_y = screen_height - 50 - 12  # At bottom when tiles spawn from bottom (minus thickness)
-        health_bar_thickness = 12  # Decreased from 20
         
         # Update displayed_health: snap down immediately on loss, animate up on gain
         if current_health < displayed_health:
@@ -3105,18 +3505,14 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
         pygame.draw.rect(health_surface, (50, 50, 50, 180), (0, 0, health_bar_width, health_bar_thickness))
         
         # Draw fading white bars showing health loss
-        current_time = time.time()
-        expired_bars = []
-        for i, (bar_width, alpha, timestamp) in enumerate(lost_health_bars):
+        current_time = now
+        # Bars are appended in time order and share one fade, so expire from the front
+        while lost_health_bars and current_time - lost_health_bars[0][2] >= 0.8:
+            lost_health_bars.popleft()
+        for bar_width, alpha, timestamp in lost_health_bars:
             time_since = current_time - timestamp
-            if time_since < 0.8:  # Fade over 0.8 seconds
-                fade_alpha = int(255 * (1 - time_since / 0.8))  # Keep white color, just fade alpha
-                pygame.draw.rect(health_surface, (255, 255, 255, fade_alpha), (0, 0, bar_width, health_bar_thickness))
-            else:
-                expired_bars.append(i)
-        # Remove expired bars
-        for i in reversed(expired_bars):
-            lost_health_bars.pop(i)
+            fade_alpha = int(255 * (1 - time_since / 0.8))  # Fade over 0.8 seconds, keep white color
+            pygame.draw.rect(health_surface, (255, 255, 255, fade_alpha), (0, 0, bar_width, health_bar_thickness))
         
         # Foreground bar (colored based on health percentage, semi-transparent)
         current_bar_width = int(health_bar_width * health_percentage)
@@ -3134,104 +3530,97 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
         
         screen.blit(health_surface, (health_bar_x, health_bar_y))
 
+        # Fading tiles, particles, hit glows and impact waves are drawn with one blits() call
+        effect_blits = []
+
         # Draw fading tiles (missed notes)
         fade_duration = 0.15  # 0.15 seconds fade
-        active_fading_tiles = []
+        tile_fade_rate = 245 / fade_duration  # alpha lost per second (245 -> 0)
+        while fading_tiles and elapsed_time - fading_tiles[0][4] >= fade_duration:
+            fading_tiles.popleft()
         for box_idx, color, x, y, fade_start_time in fading_tiles:
-            time_since_fade = elapsed_time - fade_start_time
-            if time_since_fade < fade_duration:
-                # Calculate fade alpha (245 -> 0)
-                fade_progress = time_since_fade / fade_duration
-                alpha = int(245 * (1 - fade_progress))
-                
-                indicator_color = (255, 0, 0) if color == 'red' else (0, 0, 255)
-                border_color = (255, 255, 255) if color == 'red' else (255, 215, 0)  # White border for red, yellow for blue
-                indicator_surface = pygame.Surface((indicator_size, indicator_size), pygame.SRCALPHA)
-                # Draw border first
-                pygame.draw.rect(indicator_surface, (*border_color, alpha), (0, 0, indicator_size, indicator_size), 0, 8)
-                # Draw colored fill slightly smaller to create border effect
-                pygame.draw.rect(indicator_surface, (*indicator_color, alpha), (3, 3, indicator_size - 6, indicator_size - 6), 0, 6)
-                screen.blit(indicator_surface, (int(x - indicator_size // 2), int(y - indicator_size // 2)))
-                active_fading_tiles.append((box_idx, color, x, y, fade_start_time))
-        fading_tiles = active_fading_tiles
+            alpha = int(245 - (elapsed_time - fade_start_time) * tile_fade_rate)
+            
+            indicator_surface = get_indicator_surface(color, alpha)
+            effect_blits.append((indicator_surface, (int(x - half_indicator), int(y - half_indicator))))
 
         # ===== RENDER PARTICLE EFFECTS (drawn on top of boxes) =====
-        current_time = time.time()
+        current_time = now
         particle_lifetime = 0.6
+        particle_fade_rate = 255 / particle_lifetime  # alpha lost per second
         
-        # Update and render particles
-        active_particles = []
+        # Expire from the front (all particles share one lifetime), then render the rest
+        while particles and current_time - particles[0][6] >= particle_lifetime:
+            particles.popleft()
         for px, py, vx, vy, color, size, birth_time in particles:
             age = current_time - birth_time
-            if age < particle_lifetime:
-                # Update position
-                new_px = px + vx * age
-                new_py = py + vy * age + 200 * age * age  # Gravity
-                
-                # Calculate alpha fade
-                alpha = int(255 * (1 - age / particle_lifetime))
-                
-                # Draw particle
-                if alpha > 0:
-                    particle_surface = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-                    pygame.draw.circle(particle_surface, (*color, alpha), (int(size), int(size)), int(size))
-                    screen.blit(particle_surface, (int(new_px - size), int(new_py - size)))
-                    active_particles.append((px, py, vx, vy, color, size, birth_time))
-        particles = active_particles
+            # Update position
+            new_px = px + vx * age
+            new_py = py + (vy + 200 * age) * age  # Gravity
+            
+            # Calculate alpha fade
+            alpha = int(255 - age * particle_fade_rate)
+            
+            # Draw particle
+            if alpha > 0:
+                particle_surface = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
+                pygame.draw.circle(particle_surface, (*color, alpha), (int(size), int(size)), int(size))
+                effect_blits.append((particle_surface, (int(new_px - size), int(new_py - size))))
         
         # ===== RENDER HIT GLOW EFFECTS =====
         glow_duration = 0.35
-        active_glows = []
+        glow_rate = 1 / glow_duration
+        while hit_glows and current_time - hit_glows[0][1] >= glow_duration:
+            hit_glows.popleft()
         for glow_box_idx, glow_start_time, intensity in hit_glows:
             glow_age = current_time - glow_start_time
-            if glow_age < glow_duration:
-                # Calculate glow properties
-                progress = glow_age / glow_duration
-                max_radius = 80 * intensity
-                current_radius = max_radius * progress
-                alpha = int(180 * (1 - progress) * intensity)
+            # Calculate glow properties
+            progress = glow_age * glow_rate
+            max_radius = 80 * intensity
+            current_radius = max_radius * progress
+            alpha = int(180 * (1 - progress) * intensity)
+            
+            if alpha > 0:
+                # Get box center
+                glow_x, glow_y = box_centers[glow_box_idx]
                 
-                if alpha > 0:
-                    # Get box center
-                    box_centers = box_centers_display()
-                    glow_x, glow_y = box_centers[glow_box_idx]
-                    
-                    # Apply shake offset if this box is shaking
-                    if shake_box == glow_box_idx:
-                        glow_x += shake_x
-                        glow_y += shake_y
-                    
-                    # Draw radial glow (multiple circles for soft glow effect)
-                    for i in range(3):
-                        radius = int(current_radius - i * 10)
-                        if radius > 0:
-                            glow_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                            layer_alpha = max(0, min(255, int(alpha / (i + 1))))
-                            pygame.draw.circle(glow_surface, (255, 255, 255, layer_alpha), (radius, radius), radius)
-                            screen.blit(glow_surface, (int(glow_x - radius), int(glow_y - radius)))
-                    
-                    active_glows.append((glow_box_idx, glow_start_time, intensity))
-        hit_glows = active_glows
+                # Apply shake offset if this box is shaking
+                if shake_box == glow_box_idx:
+                    glow_x += shake_x
+                    glow_y += shake_y
+                
+                # Draw radial glow (multiple circles for soft glow effect)
+                for i in range(3):
+                    radius = int(current_radius - i * 10)
+                    if radius > 0:
+                        glow_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+                        layer_alpha = max(0, min(255, int(alpha / (i + 1))))
+                        pygame.draw.circle(glow_surface, (255, 255, 255, layer_alpha), (radius, radius), radius)
+                        effect_blits.append((glow_surface, (int(glow_x - radius), int(glow_y - radius))))
         
         # ===== RENDER IMPACT WAVES =====
         wave_duration = 0.4
-        active_waves = []
+        wave_rate = 1 / wave_duration
+        while impact_waves and current_time - impact_waves[0][2] >= wave_duration:
+            impact_waves.popleft()
         for wave_x, wave_y, wave_start_time, wave_color in impact_waves:
             wave_age = current_time - wave_start_time
-            if wave_age < wave_duration:
-                progress = wave_age / wave_duration
-                wave_radius = int(50 + progress * 70)
-                # Reduced alpha from 200 to 100 for more subtle waves
-                wave_alpha = int(100 * (1 - progress))
-                wave_thickness = max(1, int(4 * (1 - progress)))
-                
-                if wave_alpha > 0:
-                    wave_surface = pygame.Surface((wave_radius * 2 + 10, wave_radius * 2 + 10), pygame.SRCALPHA)
-                    pygame.draw.circle(wave_surface, (*wave_color, wave_alpha), 
-                                     (wave_radius + 5, wave_radius + 5), wave_radius, wave_thickness)
-                    screen.blit(wave_surface, (int(wave_x - wave_radius - 5), int(wave_y - wave_radius - 5)))
-                    active_waves.append((wave_x, wave_y, wave_start_time, wave_color))
-        impact_waves = active_waves
+            progress = wave_age * wave_rate
+            wave_radius = int(50 + progress * 70)
+            # Reduced alpha from 200 to 100 for more subtle waves
+            wave_alpha = int(100 * (1 - progress))
+            wave_thickness = max(1, int(4 * (1 - progress)))
+            
+            if wave_alpha > 0:
+                wave_surface = pygame.Surface((wave_radius * 2 + 10, wave_radius * 2 + 10), pygame.SRCALPHA)
+                pygame.draw.circle(wave_surface, (*wave_color, wave_alpha), 
+                                 (wave_radius + 5, wave_radius + 5), wave_radius, wave_thickness)
+                effect_blits.append((wave_surface, (int(wave_x - wave_radius - 5), int(wave_y - wave_radius - 5))))
+
+        screen.blits(effect_blits, doreturn=0)
+
+        # Judgment, combo, metadata and stats text are drawn with one blits() call
+        text_blits = []
 
         # Judgment display (singleton pattern)
         if current_judgment['is_visible']:
@@ -3258,21 +3647,24 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                     offset_move = time_since_update * 20
                     display_y -= offset_move
                 
-                judgment_surface = font_judgment.render(current_judgment['text'], True, WHITE)
+                judgment_surface = judgment_surfaces[current_judgment['text']]
                 judgment_surface.set_alpha(alpha)
                 text_rect = judgment_surface.get_rect(center=(int(display_x), int(display_y)))
-                screen.blit(judgment_surface, text_rect)
+                text_blits.append((judgment_surface, text_rect))
                 
                 # Clear just_appeared flag after animation
                 if time_since_update >= 0.4:
                     current_judgment['just_appeared'] = False
 
         # Combo
-        combo_text_str = f"{combo}x"
-        combo_surface = font_combo.render(combo_text_str, True, WHITE)
+        # Combo only changes on hits and misses, so re-render only when it does
+        if combo != combo_surface_value:
+            combo_surface_value = combo
+            combo_base_surface = font_combo.render(f"{combo}x", True, WHITE)
+        combo_surface = combo_base_surface
 
         if combo > 0:
-            time_since_pop = time.time() - combo_pop_time
+            time_since_pop = now - combo_pop_time
             if time_since_pop < combo_animation_duration:
                 anim_progress = time_since_pop / combo_animation_duration
                 ease = 1 - (1 - anim_progress) ** 2
@@ -3287,81 +3679,18 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
         else:
             rotation_angle = 0
 
-        rotated_combo = pygame.transform.rotate(combo_surface, rotation_angle)
+        # Outside the pop animation the cached surface is blitted as is
+        rotated_combo = pygame.transform.rotate(combo_surface, rotation_angle) if rotation_angle else combo_surface
         if scroll_direction == 'down':
             combo_rect = rotated_combo.get_rect(bottomleft=(35, screen_height - 155))
         else:  # 'up'
             combo_rect = rotated_combo.get_rect(topleft=(35, 155))
-        screen.blit(rotated_combo, combo_rect)
-
-        # Metadata + image
-        if scroll_direction == 'down':
-            stats_start_y = 20  # Top when tiles spawn from top
-        else:  # 'up'
-            stats_start_y = screen_height - 20  # Bottom when tiles spawn from bottom
-        right_margin = 20
-
-        if 'meta' in level_data and any(k in level_data['meta'] for k in ['title', 'artist', 'creator', 'version']):
-            meta = level_data['meta']
-            title = meta.get('title', 'Unknown')
-            artist = meta.get('artist', 'Unknown')
-            creator = meta.get('creator', 'Unknown')
-            version = meta.get('version', 'Unknown')
-            
-            # Determine difficulty color based on version name (matching level selector colors)
-            version_lower = version.lower()
-            if 'easy' in version_lower or 'beginner' in version_lower:
-                diff_color = (100, 200, 255)  # Light blue
-            elif 'medium' in version_lower or 'platter' in version_lower:
-                diff_color = (150, 220, 150)  # Medium light green
-            elif 'normal' in version_lower or 'basic' in version_lower:
-                diff_color = (100, 255, 100)  # Green
-            elif 'hard' in version_lower or 'advanced' in version_lower:
-                diff_color = (255, 200, 100)  # Orange
-            elif 'expert' in version_lower or 'insane' in version_lower:
-                diff_color = (255, 100, 100)  # Red
-            elif 'extra' in version_lower or 'challenge' in version_lower or 'master' in version_lower:
-                diff_color = (200, 100, 255)  # Purple
-            else:
-                diff_color = (200, 200, 200)  # Gray (default)
-
-            metadata_lines = [
-                (f"{title} - {artist}", (255, 255, 255)),
-                (f"[{version}] by {creator}", diff_color)
-            ]
-
-            for i, (line, color) in enumerate(metadata_lines):
-                meta_text = font_metadata.render(line, True, color)
-                if scroll_direction == 'down':
-                    meta_rect = meta_text.get_rect(right=screen_width - right_margin, top=stats_start_y + i * 25)
-                else:  # 'up'
-                    meta_rect = meta_text.get_rect(right=screen_width - right_margin, bottom=stats_start_y - i * 25)
-                screen.blit(meta_text, meta_rect)
-            
-            if scroll_direction == 'down':
-                stats_start_y += len(metadata_lines) * 25 + 5
-            else:  # 'up'
-                stats_start_y -= len(metadata_lines) * 25 + 5
-        
-        # Autoplay indicator below title/charter
-        if autoplay_enabled:
-            autoplay_text = font_metadata.render("AUTOPLAY", True, (255, 100, 100))
-            if scroll_direction == 'down':
-                autoplay_rect = autoplay_text.get_rect(right=screen_width - right_margin, top=stats_start_y)
-            else:  # 'up'
-                autoplay_rect = autoplay_text.get_rect(right=screen_width - right_margin, bottom=stats_start_y)
-            screen.blit(autoplay_text, autoplay_rect)
-            if scroll_direction == 'down':
-                stats_start_y += 30
-            else:  # 'up'
-                stats_start_y -= 30
-
-            stats_start_y += len(metadata_lines) * 25 + 10
+        text_blits.append((rotated_combo, combo_rect))
 
         # Stats
         total_possible = total_notes * 500  # Max score is 500 (fantastic)
         accuracy = (score / total_possible * 100) if total_possible > 0 else 100.0
-        completion = (current_event_index / len(level) * 100) if len(level) > 0 else 0
+        completion = (current_event_index / level_count * 100) if level_count > 0 else 0
 
         stats_data = [
             (f"{score}", "Score"),
@@ -3380,53 +3709,39 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                 y_pos = stats_bottom_y - (i + 1) * 40
             else:  # 'up'
                 y_pos = stats_bottom_y + i * 40
-            label_text = font_stats.render(label, True, WHITE)
-            label_rect = label_text.get_rect(left=left_margin, top=y_pos)
-            screen.blit(label_text, label_rect)
-
-            number_text = font_stats.render(number, True, WHITE)
+            # Numbers change only on hits, so re-render just when the string differs
+            cached_number = stats_number_surfaces.get(label)
+            if cached_number is None or cached_number[0] != number:
+                cached_number = stats_number_surfaces[label] = (number, font_stats.render(number, True, WHITE))
+            number_text = cached_number[1]
             number_rect = number_text.get_rect(left=left_margin + 140, top=y_pos)
-            screen.blit(number_text, number_rect)
+            text_blits.append((number_text, number_rect))
 
-        # Dots
-        dot_size = 35
-        
-        # Determine which boxes have active keys pressed (from 8-key system)
-        active_boxes = set()
-        for key in keys_pressed:
-            if key in KEY_MAPPINGS:
-                # A key can map to multiple (color, box) pairs
-                for color, box_idx in KEY_MAPPINGS[key]:
-                    active_boxes.add(box_idx)
-        
-        # Detect newly activated dots and trigger animations for all of them
-        newly_active = active_boxes - last_active_dots
-        for dot_idx in newly_active:
-            current_time_local = time.time()
-            dot_pulse_times[dot_idx] = current_time_local
-            dot_switch_ripples.append((dot_idx, current_time_local))
-        
-        # Update last active dots
-        last_active_dots = active_boxes.copy()
+        screen.blits(text_blits, doreturn=0)
+
+        # Boxes with active keys pressed (from 8-key system) are kept in held_boxes;
+        # only diff when they differ from last frame (a key event or an autoplay hit)
+        if held_boxes != last_active_dots:
+            # Detect newly activated dots and trigger animations for all of them
+            for dot_idx in held_boxes - last_active_dots:
+                dot_pulse_times[dot_idx] = now
+                dot_switch_ripples.append((dot_idx, now))
+            
+            # Update last active dots
+            last_active_dots = set(held_boxes)
         
         # Dots removed for horizontal layout - no dot rendering needed
 
         # Countdown - positioned above play area, below HP bar
         if display_time < 3.0:
-            if display_time < 1.0:
-                countdown_text = "3"
-            elif display_time < 2.0:
-                countdown_text = "2"
-            else:
-                countdown_text = "1"
-
             flash_cycle = (display_time % 1.0)
             if flash_cycle < 0.15:
                 alpha = int(255 * (flash_cycle / 0.15))
             else:
                 alpha = int(255 * (1 - (flash_cycle - 0.15) / 0.85))
 
-            countdown_surface = font_countdown.render(countdown_text, True, (255, 255, 255))
+            # "3", "2", "1" for each second of the countdown
+            countdown_surface = countdown_surfaces[min(2, max(0, int(display_time)))]
             countdown_surface.set_alpha(alpha)
             # Position below health bar (health_bar_y + health_bar_thickness + margin)
             countdown_y = health_bar_y + health_bar_thickness + 80
@@ -3435,8 +3750,6 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
 
         # Fade-in overlay
         if fade_in_alpha > 0:
-            fade_overlay = pygame.Surface((screen_width, screen_height))
-            fade_overlay.fill((0, 0, 0))
             fade_overlay.set_alpha(fade_in_alpha)
             screen.blit(fade_overlay, (0, 0))
 
@@ -3448,15 +3761,15 @@ def main(level_json=None, audio_dir=None, returning_from_game=False, preloaded_m
                 # Reduced intensity - multiply by 0.3 to make it much more subtle
                 current_flash_alpha = int(screen_flash_alpha * (1 - flash_age / flash_duration) * 0.3)
                 if current_flash_alpha > 0:
-                    flash_surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-                    flash_surface.fill((255, 255, 255, current_flash_alpha))
-                    screen.blit(flash_surface, (0, 0))
+                    flash_overlay.set_alpha(current_flash_alpha)
+                    screen.blit(flash_overlay, (0, 0))
             else:
                 screen_flash_alpha = 0
 
         pygame.display.flip()
         clock.tick(120)
 
+    pygame.time.set_timer(MUSIC_START_EVENT, 0)
     pygame.mixer.music.stop()
     return None
 
@@ -665,6 +665,28 @@ def convert_chart_to_json(sm_data, chart, colors=['red', 'blue']): #, 'yellow',
     notes.sort(key=lambda x: x['t'])
     return notes
 
+def _extract_zip_parallel(zip_ref, dest):
+    """Extract all members of an open ZIP, writing files from a thread pool."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    members = zip_ref.infolist()
+    
+    # Folders first (serially) so most parent dirs already exist when the workers start
+    for member in members:
+        if member.is_dir():
+            zip_ref.extract(member, dest)
+    
+    def extract_member(member):
+        try:
+            zip_ref.extract(member, dest)
+        except FileExistsError:
+            # Another worker created the same parent folder between ZipFile's exists check and makedirs
+            zip_ref.extract(member, dest)
+    
+    # ZipFile serializes the raw reads internally; decompression and file writes overlap across threads
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(extract_member, [m for m in members if not m.is_dir()]))
+
 def extract_songpack(zip_path, extract_to='songpacks/extracted'):
     """
     Extract a song pack ZIP file.
@@ -685,7 +707,7 @@ def extract_songpack(zip_path, extract_to='songpacks/extracted'):
         os.makedirs(pack_dir, exist_ok=True)
         
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(pack_dir)
+            _extract_zip_parallel(zip_ref, pack_dir)
         
         print(f"Extracted '{pack_name}'")
     
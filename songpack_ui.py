@@ -1309,7 +1309,7 @@ def show_pack_levels_selector(screen, pack_info, game_settings, resource_path_fu
                     bg_image = image_cache[bg_path]
                 elif os.path.exists(bg_path):
                     try:
-                        bg_image = pygame.image.load(bg_path)
+                        bg_image = pygame.image.load(bg_path).convert()
                         image_cache[bg_path] = bg_image
                     except:
                         pass
@@ -1420,7 +1420,7 @@ def show_pack_levels_selector(screen, pack_info, game_settings, resource_path_fu
                     bg_image = image_cache[bg_path]
                 elif os.path.exists(bg_path):
                     try:
-                        bg_image = pygame.image.load(bg_path)
+                        bg_image = pygame.image.load(bg_path).convert()
                         image_cache[bg_path] = bg_image
                     except:
                         pass